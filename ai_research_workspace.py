@@ -7,14 +7,25 @@ Real collaborative multi-agent research platform with stunning UI
 import streamlit as st
 import sys
 import os
-import time
 from datetime import datetime
+import functools
+import hashlib
+import io
+import itertools
 import json
+import re
+import threading
+import time
 import uuid
-import plotly.express as px
-import plotly.graph_objects as go
-import pandas as pd
-from typing import Dict, List, Any
+from collections import OrderedDict, defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse
+from typing import Dict, List, Any, Optional
+
+try:
+    import orjson  # Optional: much faster JSON export
+except ImportError:
+    orjson = None
 
 # Add project paths
 current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -25,6 +36,7 @@ sys.path.append(os.path.join(current_dir, 'research_workspace'))
 try:
     from research_workspace.core.enhanced_research_engine import EnhancedResearchEngine
     from research_workspace.core.agent_collaboration import AgentCollaborationManager
+    from research_workspace.core.keyword_matcher import KeywordMatcher
     from research_workspace.agents import AVAILABLE_AGENTS
     from enhanced_display_functions import display_enhanced_research_results, generate_enhanced_pdf_report
 except ImportError as e:
@@ -32,6 +44,9 @@ except ImportError as e:
     st.error("Please check that all required files are present in the repository.")
     st.stop()
 
+# Agent display names, resolved once instead of walking the registry inside loops
+_AGENT_NAMES = {agent_id: agent_info['name'] for agent_id, agent_info in AVAILABLE_AGENTS.items()}
+
 # Page configuration
 st.set_page_config(
     page_title="AI Research Workspace",
@@ -41,7 +56,7 @@ st.set_page_config(
 )
 
 # Enhanced CSS for stunning UI
-st.markdown("""
+_CSS = """
 <style>
     /* Main theme */
     .main {
@@ -114,6 +129,11 @@ st.markdown("""
     }
 
     /* Agent cards */
+    .agent-grid {
+        display: grid;
+        grid-template-columns: repeat(4, 1fr);
+    }
+
     .agent-card {
         background: linear-gradient(135deg, #21262D 0%, #30363D 100%);
         border: 2px solid #30363D;
@@ -347,24 +367,73 @@ st.markdown("""
         border-left: 4px solid #4ECDC4;
     }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+@st.cache_resource
+def _minified_css() -> str:
+    """Strip comments and whitespace from the stylesheet once per process"""
+    css = re.sub(r'/\*.*?\*/', '', _CSS, flags=re.DOTALL)
+    css = re.sub(r'\s+', ' ', css)
+    return re.sub(r'\s*([{};])\s*', r'\1', css).strip()
+
+# Full results kept per session; history entries beyond this show as expired
+_RESULTS_PER_SESSION = 5
+
+# Per-session defaults as (key, factory) so mutable values are never shared between sessions
+_SESSION_DEFAULTS = (
+    ('research_history', lambda: deque(maxlen=100)),
+    ('research_results', lambda: _ResultStore(max_entries=_RESULTS_PER_SESSION)),
+    ('current_session_id', lambda: str(uuid.uuid4())),
+    ('selected_agents', list),
+    ('research_job', lambda: None),
+)
 
 def initialize_session_state():
     """Initialize session state variables"""
-    if 'collaboration_manager' not in st.session_state:
-        st.session_state.collaboration_manager = AgentCollaborationManager()
-
-    if 'research_engine' not in st.session_state:
-        st.session_state.research_engine = EnhancedResearchEngine()
-
-    if 'research_history' not in st.session_state:
-        st.session_state.research_history = []
-
-    if 'current_session_id' not in st.session_state:
-        st.session_state.current_session_id = str(uuid.uuid4())
-
-    if 'selected_agents' not in st.session_state:
-        st.session_state.selected_agents = []
+    for key, factory in _SESSION_DEFAULTS:
+        if key not in st.session_state:
+            st.session_state[key] = factory()
+
+@st.cache_resource
+def get_research_engine() -> EnhancedResearchEngine:
+    """Shared research engine - one instance for all sessions"""
+    return EnhancedResearchEngine()
+
+@st.cache_resource
+def get_collaboration_manager() -> AgentCollaborationManager:
+    """Shared collaboration manager - sessions inside it are keyed by their own id"""
+    return AgentCollaborationManager()
+
+class _ResultStore:
+    """LRU of full research results; session history only keeps their keys"""
+
+    def __init__(self, max_entries: int):
+        self._results = OrderedDict()
+        self._lock = threading.Lock()
+        self._max_entries = max_entries
+
+    def put(self, key: str, result: Dict[str, Any]):
+        with self._lock:
+            self._results[key] = result
+            self._results.move_to_end(key)
+            while len(self._results) > self._max_entries:
+                self._results.popitem(last=False)
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            result = self._results.get(key)
+            if result is not None:
+                self._results.move_to_end(key)
+            return result
+
+def get_result_store() -> _ResultStore:
+    """This session's result storage - other sessions never evict it, and it ends with the session"""
+    return st.session_state.research_results
+
+@st.cache_resource
+def get_research_executor() -> ThreadPoolExecutor:
+    """Process-wide worker pool so research jobs outlive the script run that started them"""
+    return ThreadPoolExecutor(max_workers=4, thread_name_prefix="research-job")
 
 def render_header():
     """Render the stunning header"""
@@ -394,24 +463,27 @@ def render_agent_selection():
     """Render the beautiful agent selection interface"""
     st.markdown("### 🎯 Choose Your Research Agents")
 
-    # Create responsive grid
-    cols = st.columns(4)
-
-    for idx, (agent_id, agent_info) in enumerate(AVAILABLE_AGENTS.items()):
-        with cols[idx % 4]:
-            # Check if agent is selected
-            is_selected = agent_id in st.session_state.selected_agents
-
-            # Create clickable agent card
-            card_class = "agent-card selected" if is_selected else "agent-card"
+    # All cards go out in a single markdown element laid out by a CSS grid
+    card_parts = []
+    for agent_id, agent_info in AVAILABLE_AGENTS.items():
+        # Check if agent is selected
+        card_class = "agent-card selected" if agent_id in st.session_state.selected_agents else "agent-card"
 
-            st.markdown(f"""
+        card_parts.append(f"""
             <div class="{card_class}" onclick="toggleAgent('{agent_id}')">
                 <div class="agent-icon">{agent_info['icon']}</div>
                 <div class="agent-name">{agent_info['name']}</div>
                 <div class="agent-specialty">{agent_info['specialty']}</div>
-            </div>
-            """, unsafe_allow_html=True)
+            </div>""")
+
+    st.markdown(f'<div class="agent-grid">{"".join(card_parts)}</div>', unsafe_allow_html=True)
+
+    # Selection controls in one column pass, aligned with the grid above
+    cols = st.columns(4)
+
+    for idx, (agent_id, agent_info) in enumerate(AVAILABLE_AGENTS.items()):
+        with cols[idx % 4]:
+            is_selected = agent_id in st.session_state.selected_agents
 
             # Agent selection checkbox
             if st.checkbox(f"Select {agent_info['name']}", key=f"select_{agent_id}", value=is_selected):
@@ -423,11 +495,12 @@ def render_agent_selection():
 
             # Agent details in expander
             with st.expander(f"🔍 {agent_info['name']} Details"):
-                st.markdown(f"**Description:** {agent_info['description']}")
-                st.markdown("**Capabilities:**")
-                for capability in agent_info['use_cases'][:3]:
-                    st.markdown(f"• {capability}")
-                st.markdown(f"**Keywords:** {', '.join(agent_info['keywords'][:5])}")
+                capabilities = "\n\n".join(f"• {capability}" for capability in agent_info['use_cases'][:3])
+                st.markdown(
+                    f"**Description:** {agent_info['description']}\n\n"
+                    f"**Capabilities:**\n\n{capabilities}\n\n"
+                    f"**Keywords:** {', '.join(agent_info['keywords'][:5])}"
+                )
 
 def render_query_interface():
     """Render the research query interface"""
@@ -444,7 +517,7 @@ def render_query_interface():
 
     # Auto-suggest agents based on query
     if query and len(query) > 10:
-        suggested_agents = suggest_agents_for_query(query)
+        suggested_agents = suggest_agents_for_query(query.lower())
         if suggested_agents:
             st.markdown("**💡 Suggested Agents:**")
             suggestion_cols = st.columns(len(suggested_agents))
@@ -475,125 +548,230 @@ def render_query_interface():
         if st.button(
             "🚀 START RESEARCH",
             type="primary",
-            disabled=not query or not st.session_state.selected_agents,
+            disabled=not query or not st.session_state.selected_agents or st.session_state.research_job is not None,
             use_container_width=True
         ):
             execute_research(query, st.session_state.selected_agents, collaboration_mode)
 
     st.markdown('</div>', unsafe_allow_html=True)
 
-def suggest_agents_for_query(query: str) -> List[str]:
-    """Suggest relevant agents based on query analysis"""
-    query_lower = query.lower()
-    agent_scores = {}
+def _build_agent_suggestion_index() -> Dict[str, List[tuple]]:
+    """Map each term to (agent_id, weight): keywords count 1, use-case words (len > 3) count 0.5 per occurrence"""
+    index = defaultdict(list)
 
     for agent_id, agent_info in AVAILABLE_AGENTS.items():
-        score = 0
+        weights = {}
 
-        # Check keywords
         for keyword in agent_info['keywords']:
-            if keyword in query_lower:
-                score += 1
+            weights[keyword] = weights.get(keyword, 0) + 1
 
-        # Check use cases
         for use_case in agent_info['use_cases']:
-            use_case_words = use_case.lower().split()
-            for word in use_case_words:
-                if word in query_lower and len(word) > 3:
-                    score += 0.5
+            for word in use_case.lower().split():
+                if len(word) > 3:
+                    weights[word] = weights.get(word, 0) + 0.5
 
-        agent_scores[agent_id] = score
+        for term, weight in weights.items():
+            index[term].append((agent_id, weight))
 
-    # Return top 3 agents with score > 0
-    sorted_agents = sorted(agent_scores.items(), key=lambda x: x[1], reverse=True)
-    return [agent_id for agent_id, score in sorted_agents if score > 0][:3]
+    return dict(index)
 
-def execute_research(query: str, selected_agents: List[str], collaboration_mode: str):
-    """Execute the research with real agent collaboration"""
+_AGENT_SUGGESTION_INDEX = _build_agent_suggestion_index()
 
-    # Create session
-    session_id = str(uuid.uuid4())
+@st.cache_resource
+def _agent_suggestion_matcher() -> KeywordMatcher:
+    """One matcher over every agent's vocabulary, compiled once per process"""
+    return KeywordMatcher(_AGENT_SUGGESTION_INDEX)
 
-    # Progress container
-    progress_container = st.container()
+@st.cache_data(ttl=3600, show_spinner=False)
+def suggest_agents_for_query(query_lower: str) -> List[str]:
+    """Suggest relevant agents based on query analysis (expects the lowercased query)"""
+    # Registry order is kept so ties rank the same way as before
+    agent_scores = dict.fromkeys(AVAILABLE_AGENTS, 0)
 
-    with progress_container:
-        st.markdown('<div class="progress-container">', unsafe_allow_html=True)
-        st.markdown("### 🔄 AI Research in Progress...")
+    # Single scan of the query for all agents' terms
+    for term in _agent_suggestion_matcher().found(query_lower):
+        for agent_id, weight in _AGENT_SUGGESTION_INDEX[term]:
+            agent_scores[agent_id] += weight
+
+    # Return top 3 agents with score > 0
+    sorted_agents = sorted(agent_scores.items(), key=lambda x: x[1], reverse=True)
+    return [agent_id for agent_id, score in sorted_agents if score > 0][:3]
 
-        # Show working agents
-        agent_pills = ""
-        for agent_id in selected_agents:
-            agent_info = AVAILABLE_AGENTS[agent_id]
-            agent_pills += f'<span class="agent-working">{agent_info["icon"]} {agent_info["name"]}</span>'
+def execute_research(query: str, selected_agents: List[str], collaboration_mode: str):
+    """Submit the research to the background worker pool and return immediately"""
 
-        st.markdown(f"""
+    # Progress banner is static for the whole run, so build its HTML once
+    agent_pills = "".join(
+        f'<span class="agent-working">{AVAILABLE_AGENTS[agent_id]["icon"]} {_AGENT_NAMES[agent_id]}</span>'
+        for agent_id in selected_agents
+    )
+    banner_html = f"""
+    <div class="progress-container">
+        <h3>🔄 AI Research in Progress...</h3>
         <div style="margin: 1rem 0;">
             <p style="color: #FFFFFF; text-align: center;">Agents working on your research:</p>
             <div style="text-align: center;">{agent_pills}</div>
         </div>
-        """, unsafe_allow_html=True)
+    </div>
+    """
+
+    # Collaboration only pays off with several agents; a single agent gets the enhanced pipeline
+    enhanced_mode = len(selected_agents) < 2 or collaboration_mode not in ('parallel', 'sequential')
+
+    job = {
+        'task_id': str(uuid.uuid4()),
+        'query': query,
+        'agents': list(selected_agents),
+        'mode': collaboration_mode,
+        'enhanced_mode': enhanced_mode,
+        'status': 'running',
+        'progress': 0.0,
+        'message': "🚀 Initializing research...",
+        'result': None,
+        'error': None,
+        'partial_report': "",
+        'banner_html': banner_html,
+        'updated': threading.Event()
+    }
+
+    get_research_executor().submit(run_research_job, job, get_collaboration_manager(), get_research_engine())
+    st.session_state.research_job = job
+
+def _update_job(job: Dict[str, Any], **changes):
+    """Record worker progress on the job and wake the polling script run"""
+    job.update(changes)
+    job['updated'].set()
 
-        # Progress bar
-        progress_bar = st.progress(0)
-        status_text = st.empty()
+def run_research_job(job: Dict[str, Any], collaboration_manager: AgentCollaborationManager,
+                     research_engine: EnhancedResearchEngine):
+    """Background worker: run exactly one research path and record progress on the job"""
 
-        try:
+    def on_agent_complete(agent_id: str, completed: int, total: int):
+        _update_job(job, message=f"🤖 {_AGENT_NAMES[agent_id]} completed research...",
+                    progress=0.3 + completed * 0.6 / total)
+
+    def on_synthesis_text(text: str):
+        _update_job(job, message="✍️ Writing collaborative synthesis...",
+                    partial_report=job['partial_report'] + text)
+
+    try:
+        if job['enhanced_mode']:
+            # Enhanced pipeline: planner -> scout -> analyst -> writer
+            _update_job(job, message="🔍 Planning, searching and analyzing sources...", progress=0.3)
+
+            result = research_engine.comprehensive_research(job['query'], num_sub_questions=2)
+            completed_message = "✅ Enhanced research completed successfully!"
+        else:
             # Step 1: Initialize collaboration
-            status_text.text("🚀 Initializing agent collaboration...")
-            time.sleep(1)
-            progress_bar.progress(0.1)
+            _update_job(job, progress=0.1)
 
-            session = st.session_state.collaboration_manager.start_collaboration_session(
-                session_id, selected_agents, query
-            )
+            collaboration_manager.start_collaboration_session(job['task_id'], job['agents'], job['query'])
 
-            # Step 2: Execute collaborative research
-            status_text.text("🔍 Agents performing research...")
-            progress_bar.progress(0.3)
+            # Step 2: Execute collaborative research - selected agents run concurrently
+            _update_job(job, message="🔍 Agents performing research...", progress=0.3)
 
-            result = st.session_state.collaboration_manager.execute_collaborative_research(
-                session_id, collaboration_mode
+            result = collaboration_manager.execute_collaborative_research(
+                job['task_id'], job['mode'], on_agent_complete=on_agent_complete,
+                on_synthesis_text=on_synthesis_text
             )
+            completed_message = "✅ Collaborative research completed successfully!"
 
-            # Progress updates
-            for i, agent_id in enumerate(selected_agents):
-                agent_info = AVAILABLE_AGENTS[agent_id]
-                status_text.text(f"🤖 {agent_info['name']} completed research...")
-                progress_bar.progress(0.4 + (i + 1) * 0.4 / len(selected_agents))
-                time.sleep(0.8)
-
-            # Execute comprehensive research using Enhanced engine (optimized for speed)
-            result = st.session_state.research_engine.comprehensive_research(query, num_sub_questions=2)
+        if not result['success']:
+            _update_job(job, error=result.get('error', 'Unknown error'), status='failed')
+            return
 
-            if not result['success']:
-                st.error(f"Research failed: {result.get('error', 'Unknown error')}")
-                return
+        _update_job(job, progress=1.0, message=completed_message, result=result, status='completed')
 
-            progress_bar.progress(1.0)
-            status_text.text("✅ Enhanced research completed successfully!")
-            time.sleep(1)
+    except Exception as e:
+        print(f"Research error: {e}")
+        _update_job(job, error=str(e), status='failed')
 
-            # Store results
-            st.session_state.research_history.append({
-                'query': query,
-                'agents': ['enhanced_galileo'],
-                'result': result,
-                'timestamp': datetime.now(),
-                'enhanced_mode': True
-            })
+def _render_job_progress(job: Dict[str, Any]):
+    """Progress banner, bar and any streamed synthesis text for a running job"""
+    st.markdown(job['banner_html'], unsafe_allow_html=True)
+    st.progress(job['progress'], text=job['message'])
 
-            st.markdown('</div>', unsafe_allow_html=True)
+    # Synthesis text shows up as it streams instead of after the whole run
+    if job['partial_report']:
+        st.markdown(job['partial_report'])
 
-            # Clear progress and show results
-            progress_container.empty()
-            display_enhanced_research_results(result, query)
+def _collect_finished_job(job: Dict[str, Any]):
+    """Move a finished job's result into history, or its error into session state"""
+    st.session_state.research_job = None
 
-        except Exception as e:
-            st.error(f"❌ Research failed: {str(e)}")
-            print(f"Research error: {e}")
+    if job['status'] == 'failed':
+        st.session_state.research_error = job['error']
+        return
 
-def display_research_results(result: Dict[str, Any], query: str, agents: List[str]):
+    # Sidebar label is computed once here rather than on every rerun
+    if job['enhanced_mode']:
+        agents_display = "Enhanced Research Engine (Planner + Scout + Analyst + Writer)"
+    else:
+        agents_display = ', '.join(
+            _AGENT_NAMES.get(agent_id) or agent_id.replace('_', ' ').title()
+            for agent_id in job['agents']
+        ) or 'None'
+
+    # Store results - the heavy result dict lives in the shared LRU store, not in session state
+    get_result_store().put(job['task_id'], job['result'])
+    st.session_state.research_history.append({
+        'query': job['query'],
+        'agents': job['agents'],
+        'agents_display': agents_display,
+        'result_key': job['task_id'],
+        # Stable widget-key suffix for this result, so reruns don't remount its download buttons
+        'session_key': f"{int(time.time())}_{hashlib.md5(job['query'].encode()).hexdigest()[:8]}",
+        'timestamp': datetime.now(),
+        'enhanced_mode': job['enhanced_mode']
+    })
+
+def poll_research_job(progress_slot):
+    """Fallback for Streamlit builds without fragments: poll the job with full-page reruns"""
+
+    job = st.session_state.research_job
+    if job is None:
+        return
+
+    if job['status'] == 'running':
+        with progress_slot.container():
+            _render_job_progress(job)
+
+        # Re-render as soon as the worker reports progress rather than on a fixed tick
+        job['updated'].wait(timeout=5)
+        job['updated'].clear()
+        st.rerun()
+
+    _collect_finished_job(job)
+    st.rerun()
+
+# Fragments rerun on their own, so progress ticks no longer re-execute the whole page
+_fragment = getattr(st, 'fragment', None) or getattr(st, 'experimental_fragment', None)
+
+if _fragment is not None:
+    @_fragment(run_every=0.5)
+    def _research_progress_panel():
+        """Self-refreshing progress panel; triggers one full rerun when the job finishes"""
+        job = st.session_state.research_job
+        if job is None:
+            return
+
+        if job['status'] == 'running':
+            _render_job_progress(job)
+            return
+
+        _collect_finished_job(job)
+        st.rerun()
+else:
+    _research_progress_panel = None
+
+def _source_title_and_url(source: Any, default_title: str = 'Source', default_url: str = '') -> tuple:
+    """Collaborative results carry plain URL strings, search results carry title/link dicts"""
+    if isinstance(source, str):
+        return source, source
+    return source.get('title', default_title), source.get('link', source.get('url', default_url))
+
+def display_research_results(result: Dict[str, Any], query: str, agents: List[str],
+                             generated_at: Optional[datetime] = None):
     """Display comprehensive research results"""
 
     st.markdown("## 📊 Research Results")
@@ -616,20 +794,18 @@ def display_research_results(result: Dict[str, Any], query: str, agents: List[st
         st.markdown("### 📋 Comprehensive Report")
         # Add source links directly in the report
         if result.get('individual_results'):
-            all_sources = []
-            for agent_id in agents:
-                agent_result = result['individual_results'].get(agent_id, {})
-                agent_sources = agent_result.get('sources', [])
-                all_sources.extend(agent_sources)
+            # Only the first 50 sources are listed, so stream them instead of building the full list
+            all_sources = itertools.chain.from_iterable(
+                result['individual_results'].get(agent_id, {}).get('sources', []) for agent_id in agents
+            )
 
             # Add sources at the end of the report
-            synthesis_with_sources = synthesis_text + "\n\n## 📚 Sources\n\n"
-            for i, source in enumerate(all_sources[:50], 1):
-                title = source.get('title', 'Source')
-                url = source.get('link', source.get('url', '#'))
-                synthesis_with_sources += f"{i}. [{title}]({url})\n"
+            report_parts = [synthesis_text, "\n\n## 📚 Sources\n\n"]
+            for i, source in enumerate(itertools.islice(all_sources, 50), 1):
+                title, url = _source_title_and_url(source, default_url='#')
+                report_parts.append(f"{i}. [{title}]({url})\n")
 
-            st.markdown(synthesis_with_sources)
+            st.markdown("".join(report_parts))
         else:
             st.markdown(synthesis_text)
 
@@ -638,20 +814,23 @@ def display_research_results(result: Dict[str, Any], query: str, agents: List[st
     render_analytics_dashboard(result, agents)
 
     # Export options
-    render_export_options(result, query, agents)
+    render_export_options(result, query, agents, generated_at)
 
 
 def render_analytics_dashboard(result: Dict[str, Any], agents: List[str]):
     """Render simplified analytics dashboard"""
     col1, col2, col3 = st.columns(3)
 
-    # Count total sources from all agents
+    # Count total sources and average confidence from all agents in one pass
     total_sources = 0
+    confidence_sum = 0.0
+    confidence_count = 0
     if result.get('individual_results'):
         for agent_id in agents:
             agent_result = result['individual_results'].get(agent_id, {})
-            agent_sources = agent_result.get('sources', [])
-            total_sources += len(agent_sources)
+            total_sources += len(agent_result.get('sources', []))
+            confidence_sum += agent_result.get('confidence', 0.8)
+            confidence_count += 1
 
     with col1:
         st.metric("📊 Total Sources", total_sources)
@@ -661,12 +840,8 @@ def render_analytics_dashboard(result: Dict[str, Any], agents: List[str]):
         confidence = 0.8  # default
         if result.get('synthesized_result', {}).get('confidence_assessment'):
             confidence = result['synthesized_result']['confidence_assessment']
-        elif result.get('individual_results'):
-            confidences = []
-            for agent_id in agents:
-                agent_result = result['individual_results'].get(agent_id, {})
-                confidences.append(agent_result.get('confidence', 0.8))
-            confidence = sum(confidences) / len(confidences) if confidences else 0.8
+        elif confidence_count:
+            confidence = confidence_sum / confidence_count
 
         st.metric("🎯 Confidence", f"{confidence * 100:.1f}%")
 
@@ -674,7 +849,8 @@ def render_analytics_dashboard(result: Dict[str, Any], agents: List[str]):
         processing_time = result.get('processing_time', 0)
         st.metric("⚡ Processing Time", f"{processing_time:.1f}s")
 
-def render_export_options(result: Dict[str, Any], query: str, agents: List[str]):
+def render_export_options(result: Dict[str, Any], query: str, agents: List[str],
+                          generated_at: Optional[datetime] = None):
     """Render export options including Google Docs"""
 
     st.markdown("### 📤 Export Research Results")
@@ -687,291 +863,290 @@ def render_export_options(result: Dict[str, Any], query: str, agents: List[str])
 
     st.session_state.button_counter += 1
     unique_id = st.session_state.button_counter
+    # Exports are stamped with when the research ran, not when the page rerendered
+    if generated_at is None:
+        generated_at = datetime.now()
+    file_stamp = generated_at.strftime('%Y%m%d_%H%M%S')
 
     with col1:
         # Generate comprehensive PDF report
-        pdf_data = generate_comprehensive_pdf_report(result, query, agents)
+        pdf_data = generate_comprehensive_pdf_report(result, query, agents, generated_at)
         st.download_button(
             label="📄 Download PDF Report",
             data=pdf_data,
-            file_name=f"research_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf",
+            file_name=f"research_report_{file_stamp}.pdf",
             mime="application/pdf",
             key=f"download_pdf_report_{unique_id}"
         )
 
     with col2:
         # Generate JSON data
-        json_data = json.dumps(result, indent=2, default=str)
+        json_data = _result_json(result)
         st.download_button(
             label="📊 Download JSON Data",
             data=json_data,
-            file_name=f"research_data_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
+            file_name=f"research_data_{file_stamp}.json",
             mime="application/json",
             key=f"download_json_data_{unique_id}"
         )
 
     # Remove the export button since we now have direct PDF download
 
-def generate_comprehensive_pdf_report(result: Dict[str, Any], query: str, agents: List[str]) -> bytes:
+@st.cache_data(ttl=1800, show_spinner=False)
+def _result_json(result: Dict[str, Any]) -> bytes:
+    """Serialized research result for the JSON download, reused across reruns"""
+    if orjson is not None:
+        return orjson.dumps(result, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS, default=str)
+    return json.dumps(result, indent=2, default=str).encode('utf-8')
+
+def generate_comprehensive_pdf_report(result: Dict[str, Any], query: str, agents: List[str],
+                                     generated_at: Optional[datetime] = None) -> bytes:
     """Export research results to professional PDF"""
-    st.write("🚀 Starting PDF export...")
     try:
-        from reportlab.lib.pagesizes import letter, A4
-        from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, PageBreak
-        from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-        from reportlab.lib.units import inch
-        from reportlab.lib.colors import HexColor
-        from datetime import datetime
-        import io
-
-        # Get synthesis
-        synthesis_text = ""
-        if result.get('synthesized_result', {}).get('detailed_synthesis'):
-            synthesis_text = result['synthesized_result']['detailed_synthesis']
-        elif result.get('individual_results') and len(agents) == 1:
-            agent_id = agents[0]
-            agent_result = result['individual_results'][agent_id]
-            synthesis_text = agent_result.get('analysis', '')
-
-        # Get all sources
-        all_sources = []
-        if result.get('individual_results'):
-            for agent_id in agents:
-                agent_result = result['individual_results'].get(agent_id, {})
-                agent_sources = agent_result.get('sources', [])
-                all_sources.extend(agent_sources)
+        return _build_comprehensive_pdf(result, query, tuple(agents), generated_at or datetime.now())
 
-        # Create PDF buffer
-        buffer = io.BytesIO()
+    except Exception as e:
+        st.error(f"❌ PDF generation failed: {str(e)}")
+        st.info("💡 Make sure reportlab is installed: `pip install reportlab`")
+        return b""
 
-        # Create PDF document
-        doc = SimpleDocTemplate(buffer, pagesize=A4, rightMargin=72, leftMargin=72, topMargin=72, bottomMargin=18)
+@functools.lru_cache(maxsize=None)
+def _comprehensive_pdf_styles() -> Dict[str, Any]:
+    """ParagraphStyles for the comprehensive PDF, built once per process"""
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+    from reportlab.lib.colors import HexColor
+
+    styles = getSampleStyleSheet()
+    title_style = ParagraphStyle(
+        'CustomTitle',
+        parent=styles['Heading1'],
+        fontSize=24,
+        spaceAfter=30,
+        textColor=HexColor('#1f4e79'),
+        alignment=1  # Center alignment
+    )
 
-        # Define styles
-        styles = getSampleStyleSheet()
-        title_style = ParagraphStyle(
-            'CustomTitle',
-            parent=styles['Heading1'],
-            fontSize=24,
-            spaceAfter=30,
-            textColor=HexColor('#1f4e79'),
-            alignment=1  # Center alignment
-        )
+    heading_style = ParagraphStyle(
+        'CustomHeading',
+        parent=styles['Heading2'],
+        fontSize=16,
+        spaceAfter=12,
+        textColor=HexColor('#2c5282'),
+        spaceBefore=20
+    )
 
-        heading_style = ParagraphStyle(
-            'CustomHeading',
-            parent=styles['Heading2'],
-            fontSize=16,
-            spaceAfter=12,
-            textColor=HexColor('#2c5282'),
-            spaceBefore=20
-        )
+    normal_style = ParagraphStyle(
+        'CustomNormal',
+        parent=styles['Normal'],
+        fontSize=11,
+        spaceAfter=12,
+        leading=14
+    )
 
-        normal_style = ParagraphStyle(
-            'CustomNormal',
-            parent=styles['Normal'],
-            fontSize=11,
-            spaceAfter=12,
-            leading=14
-        )
+    return {
+        'title': title_style,
+        'heading': heading_style,
+        'normal': normal_style,
+        'agent_heading': ParagraphStyle('AgentHeading', parent=heading_style, fontSize=14, spaceAfter=8),
+        'sub_heading': ParagraphStyle('SubHeading', parent=normal_style, fontSize=12, fontWeight='bold'),
+        'source_heading': ParagraphStyle('SourceHeading', parent=normal_style, fontSize=10, fontWeight='bold'),
+        'source_text': ParagraphStyle('SourceText', parent=normal_style, fontSize=9, leftIndent=20),
+        'domain_heading': ParagraphStyle('DomainHeading', parent=normal_style, fontSize=11, fontWeight='bold', spaceAfter=5),
+        'domain_source_text': ParagraphStyle('DomainSourceText', parent=normal_style, fontSize=9, leftIndent=15, spaceAfter=3),
+        'footer': ParagraphStyle('Footer', parent=normal_style, fontSize=9, textColor=HexColor('#666666'), alignment=1)
+    }
 
-        # Build PDF content
-        story = []
-
-        # Title
-        story.append(Paragraph(f"AI Research Report: {query}", title_style))
-        story.append(Spacer(1, 20))
-
-        # Metadata
-        agents_names = [AVAILABLE_AGENTS[agent_id]['name'] for agent_id in agents]
-        story.append(Paragraph(f"<b>Research Agents:</b> {', '.join(agents_names)}", normal_style))
-        story.append(Paragraph(f"<b>Generated on:</b> {datetime.now().strftime('%B %d, %Y at %I:%M %p')}", normal_style))
-        story.append(Paragraph(f"<b>Sources Analyzed:</b> {len(all_sources)} sources", normal_style))
-        story.append(Spacer(1, 30))
-
-        # Executive Summary Section
-        story.append(Paragraph("Executive Summary", heading_style))
-        if synthesis_text:
-            summary_lines = synthesis_text.split('\n')[:5]  # First 5 lines as summary
-            summary = ' '.join([line.strip() for line in summary_lines if line.strip()])
-            story.append(Paragraph(summary, normal_style))
-        story.append(Spacer(1, 20))
-
-        # Individual Agent Analysis
-        if result.get('individual_results'):
-            story.append(Paragraph("Detailed Agent Analysis", heading_style))
-
-            for agent_id in agents:
-                agent_result = result['individual_results'].get(agent_id, {})
-                agent_name = AVAILABLE_AGENTS[agent_id]['name']
-
-                story.append(Paragraph(f"{agent_name} Analysis",
-                    ParagraphStyle('AgentHeading', parent=heading_style, fontSize=14, spaceAfter=8)))
-
-                agent_analysis = agent_result.get('analysis', '')
-                if agent_analysis:
-                    # Split into paragraphs and format
-                    paragraphs = agent_analysis.split('\n')
-                    for para in paragraphs:
-                        if para.strip():
-                            if para.startswith('#'):
-                                clean_para = para.replace('#', '').strip()
-                                story.append(Paragraph(clean_para,
-                                    ParagraphStyle('SubHeading', parent=normal_style, fontSize=12, fontWeight='bold')))
-                            else:
-                                story.append(Paragraph(para.strip(), normal_style))
-
-                # Agent-specific sources
-                agent_sources = agent_result.get('sources', [])
-                if agent_sources:
-                    story.append(Paragraph(f"{agent_name} Sources:",
-                        ParagraphStyle('SourceHeading', parent=normal_style, fontSize=10, fontWeight='bold')))
-                    for i, source in enumerate(agent_sources[:10], 1):
-                        source_title = source.get('title', 'Unknown Source')
-                        source_url = source.get('link', source.get('url', ''))
-                        story.append(Paragraph(f"{i}. {source_title}<br/><font size='8'>{source_url}</font>",
-                            ParagraphStyle('SourceText', parent=normal_style, fontSize=9, leftIndent=20)))
-
-                story.append(Spacer(1, 15))
-
-        # Comprehensive Sources section
-        if all_sources:
-            story.append(PageBreak())
-            story.append(Paragraph("Complete Source Bibliography", heading_style))
-            story.append(Paragraph(f"Total sources analyzed: {len(all_sources)}", normal_style))
-            story.append(Spacer(1, 10))
+@st.cache_data(ttl=1800, show_spinner=False)
+def _build_comprehensive_pdf(result: Dict[str, Any], query: str, agents: tuple, generated_at: datetime) -> bytes:
+    """Build the PDF bytes; cached so reruns only rebuild when the research result changes"""
+    # Imported on first export rather than when the app module loads
+    from reportlab.lib.pagesizes import A4
+    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, PageBreak
 
-            # Group sources by domain
-            domain_sources = {}
-            for source in all_sources:
-                url = source.get('link', source.get('url', ''))
-                if url:
-                    try:
-                        from urllib.parse import urlparse
-                        domain = urlparse(url).netloc
-                        if domain not in domain_sources:
-                            domain_sources[domain] = []
-                        domain_sources[domain].append(source)
-                    except:
-                        pass
-
-            for domain, sources in domain_sources.items():
-                story.append(Paragraph(f"<b>{domain}</b> ({len(sources)} sources)",
-                    ParagraphStyle('DomainHeading', parent=normal_style, fontSize=11, fontWeight='bold', spaceAfter=5)))
-
-                for i, source in enumerate(sources, 1):
-                    source_title = source.get('title', 'Unknown Source')
-                    source_url = source.get('link', source.get('url', ''))
-                    story.append(Paragraph(f"{i}. {source_title}<br/><font size='8'>{source_url}</font>",
-                        ParagraphStyle('DomainSourceText', parent=normal_style, fontSize=9, leftIndent=15, spaceAfter=3)))
+    # Get synthesis
+    synthesis_text = ""
+    if result.get('synthesized_result', {}).get('detailed_synthesis'):
+        synthesis_text = result['synthesized_result']['detailed_synthesis']
+    elif result.get('individual_results') and len(agents) == 1:
+        agent_id = agents[0]
+        agent_result = result['individual_results'][agent_id]
+        synthesis_text = agent_result.get('analysis', '')
 
-                story.append(Spacer(1, 10))
+    # Get all sources
+    all_sources = []
+    if result.get('individual_results'):
+        for agent_id in agents:
+            agent_result = result['individual_results'].get(agent_id, {})
+            agent_sources = agent_result.get('sources', [])
+            all_sources.extend(agent_sources)
 
-        # Footer
-        story.append(Spacer(1, 30))
-        story.append(Paragraph("Generated by AI Research Workspace",
-                               ParagraphStyle('Footer', parent=normal_style, fontSize=9, textColor=HexColor('#666666'), alignment=1)))
+    styles = _comprehensive_pdf_styles()
+    title_style = styles['title']
+    heading_style = styles['heading']
+    normal_style = styles['normal']
 
-        # Build PDF
-        doc.build(story)
+    # Build PDF content
+    story = []
 
-        # Get PDF data
-        buffer.seek(0)
-        pdf_data = buffer.getvalue()
-        buffer.close()
+    # Title
+    story.append(Paragraph(f"AI Research Report: {query}", title_style))
+    story.append(Spacer(1, 20))
 
-        return pdf_data
+    # Metadata
+    agents_names = [_AGENT_NAMES[agent_id] for agent_id in agents]
+    story.append(Paragraph(f"<b>Research Agents:</b> {', '.join(agents_names)}", normal_style))
+    story.append(Paragraph(f"<b>Generated on:</b> {generated_at.strftime('%B %d, %Y at %I:%M %p')}", normal_style))
+    story.append(Paragraph(f"<b>Sources Analyzed:</b> {len(all_sources)} sources", normal_style))
+    story.append(Spacer(1, 30))
 
-    except Exception as e:
-        st.error(f"❌ PDF generation failed: {str(e)}")
-        st.info("💡 Make sure reportlab is installed: `pip install reportlab`")
-        return b""
+    # Executive Summary Section
+    story.append(Paragraph("Executive Summary", heading_style))
+    if synthesis_text:
+        summary_lines = synthesis_text.split('\n')[:5]  # First 5 lines as summary
+        summary = ' '.join([line.strip() for line in summary_lines if line.strip()])
+        story.append(Paragraph(summary, normal_style))
+    story.append(Spacer(1, 20))
+
+    # Individual Agent Analysis
+    if result.get('individual_results'):
+        story.append(Paragraph("Detailed Agent Analysis", heading_style))
+
+        for agent_id in agents:
+            agent_result = result['individual_results'].get(agent_id, {})
+            agent_name = _AGENT_NAMES[agent_id]
+
+            story.append(Paragraph(f"{agent_name} Analysis",
+                styles['agent_heading']))
+
+            agent_analysis = agent_result.get('analysis', '')
+            if agent_analysis:
+                # Split into paragraphs and format
+                paragraphs = agent_analysis.split('\n')
+                for para in paragraphs:
+                    if para.strip():
+                        if para.startswith('#'):
+                            clean_para = para.replace('#', '').strip()
+                            story.append(Paragraph(clean_para,
+                                styles['sub_heading']))
+                        else:
+                            story.append(Paragraph(para.strip(), normal_style))
+
+            # Agent-specific sources
+            agent_sources = agent_result.get('sources', [])
+            if agent_sources:
+                story.append(Paragraph(f"{agent_name} Sources:",
+                    styles['source_heading']))
+                for i, source in enumerate(agent_sources[:10], 1):
+                    source_title, source_url = _source_title_and_url(source, 'Unknown Source')
+                    story.append(Paragraph(f"{i}. {source_title}<br/><font size='8'>{source_url}</font>",
+                        styles['source_text']))
+
+            story.append(Spacer(1, 15))
+
+    # Comprehensive Sources section
+    if all_sources:
+        story.append(PageBreak())
+        story.append(Paragraph("Complete Source Bibliography", heading_style))
+        story.append(Paragraph(f"Total sources analyzed: {len(all_sources)}", normal_style))
+        story.append(Spacer(1, 10))
+
+        # Group sources by domain
+        domain_sources = defaultdict(list)
+        for source in all_sources:
+            _, url = _source_title_and_url(source)
+            if url:
+                domain_sources[urlparse(url).netloc].append(source)
+
+        for domain, sources in domain_sources.items():
+            story.append(Paragraph(f"<b>{domain}</b> ({len(sources)} sources)",
+                styles['domain_heading']))
+
+            for i, source in enumerate(sources, 1):
+                source_title, source_url = _source_title_and_url(source, 'Unknown Source')
+                story.append(Paragraph(f"{i}. {source_title}<br/><font size='8'>{source_url}</font>",
+                    styles['domain_source_text']))
+
+            story.append(Spacer(1, 10))
+
+    # Footer
+    story.append(Spacer(1, 30))
+    story.append(Paragraph("Generated by AI Research Workspace",
+                           styles['footer']))
+
+    # Build PDF - platypus pops flowables off the story as it lays out pages, so
+    # nothing else may hold on to them; the buffer is released as soon as we return
+    with io.BytesIO() as buffer:
+        doc = SimpleDocTemplate(buffer, pagesize=A4, rightMargin=72, leftMargin=72, topMargin=72, bottomMargin=18)
+        doc.build(story)
+        return buffer.getvalue()
 
 def generate_markdown_report(result: Dict[str, Any], query: str, agents: List[str]) -> str:
     """Generate professional markdown report"""
 
-    report_lines = [
-        f"# AI Research Report",
-        f"",
-        f"**Query:** {query}",
-        f"**Date:** {datetime.now().strftime('%B %d, %Y at %H:%M:%S')}",
-        f"**Agents Used:** {', '.join([AVAILABLE_AGENTS[agent_id]['name'] for agent_id in agents])}",
-        f"**Processing Time:** {result.get('processing_time', 0):.2f} seconds",
-        f"",
-        f"---",
-        f""
-    ]
+    buf = io.StringIO()
+    buf.write(
+        f"# AI Research Report\n"
+        f"\n"
+        f"**Query:** {query}\n"
+        f"**Date:** {datetime.now().strftime('%B %d, %Y at %H:%M:%S')}\n"
+        f"**Agents Used:** {', '.join(_AGENT_NAMES[agent_id] for agent_id in agents)}\n"
+        f"**Processing Time:** {result.get('processing_time', 0):.2f} seconds\n"
+        f"\n"
+        f"---\n"
+        f"\n"
+    )
+
+    synthesized = result.get('synthesized_result', {})
+    individual_results = result.get('individual_results', {})
 
     # Executive summary
-    if result.get('synthesized_result', {}).get('executive_summary'):
-        report_lines.extend([
-            f"## Executive Summary",
-            f"",
-            f"{result['synthesized_result']['executive_summary']}",
-            f""
-        ])
+    if synthesized.get('executive_summary'):
+        buf.write(f"## Executive Summary\n\n{synthesized['executive_summary']}\n\n")
 
     # Key findings
-    if result.get('synthesized_result', {}).get('key_findings'):
-        report_lines.extend([
-            f"## Key Findings",
-            f""
-        ])
-        for finding in result['synthesized_result']['key_findings']:
-            report_lines.append(f"• {finding}")
-        report_lines.append("")
+    if synthesized.get('key_findings'):
+        findings_block = "".join(f"• {finding}\n" for finding in synthesized['key_findings'])
+        buf.write(f"## Key Findings\n\n{findings_block}\n")
 
     # Individual agent analyses
-    report_lines.extend([
-        f"## Individual Agent Analyses",
-        f""
-    ])
-
-    for agent_id in agents:
-        agent_info = AVAILABLE_AGENTS[agent_id]
-        agent_result = result.get('individual_results', {}).get(agent_id, {})
-
-        report_lines.extend([
-            f"### {agent_info['icon']} {agent_info['name']}",
-            f"",
-            f"**Confidence:** {agent_result.get('confidence', 0.7):.1%}",
-            f"**Sources Found:** {len(agent_result.get('sources', []))}",
-            f"",
-            f"**Summary:**",
-            f"{agent_result.get('executive_summary', 'No summary available')}",
-            f""
-        ])
-
-        if agent_result.get('key_insights'):
-            report_lines.extend([
-                f"**Key Insights:**",
-                f""
-            ])
-            for insight in agent_result['key_insights']:
-                report_lines.append(f"• {insight}")
-            report_lines.append("")
-
-    # Sources
-    all_sources = set()
-    for agent_id in agents:
-        agent_result = result.get('individual_results', {}).get(agent_id, {})
-        all_sources.update(agent_result.get('sources', []))
+    buf.write("## Individual Agent Analyses\n\n")
+
+    buf.write("".join(
+        _format_agent_section(AVAILABLE_AGENTS[agent_id], individual_results.get(agent_id, {}))
+        for agent_id in agents
+    ))
+
+    # Sources - deduplicated in the order the agents reported them
+    all_sources = dict.fromkeys(itertools.chain.from_iterable(
+        individual_results.get(agent_id, {}).get('sources', ()) for agent_id in agents
+    ))
 
     if all_sources:
-        report_lines.extend([
-            f"## Sources",
-            f""
-        ])
-        for idx, source in enumerate(sorted(all_sources), 1):
-            report_lines.append(f"{idx}. {source}")
+        buf.write("## Sources\n\n")
+        buf.write("".join(f"{idx}. {source}\n" for idx, source in enumerate(all_sources, 1)))
+
+    buf.write("\n---\n*Generated by AI Research Workspace - Collaborative Intelligence*")
+
+    return buf.getvalue()
+
+def _format_agent_section(agent_info: Dict[str, Any], agent_result: Dict[str, Any]) -> str:
+    """Format one agent's section of the markdown report"""
+    section = (
+        f"### {agent_info['icon']} {agent_info['name']}\n"
+        f"\n"
+        f"**Confidence:** {agent_result.get('confidence', 0.7):.1%}\n"
+        f"**Sources Found:** {len(agent_result.get('sources', []))}\n"
+        f"\n"
+        f"**Summary:**\n"
+        f"{agent_result.get('executive_summary', 'No summary available')}\n"
+        f"\n"
+    )
 
-    report_lines.extend([
-        f"",
-        f"---",
-        f"*Generated by AI Research Workspace - Collaborative Intelligence*"
-    ])
+    if agent_result.get('key_insights'):
+        insights_block = "".join(f"• {insight}\n" for insight in agent_result['key_insights'])
+        section += f"**Key Insights:**\n\n{insights_block}\n"
 
-    return "\n".join(report_lines)
+    return section
 
 def render_sidebar():
     """Render enhanced sidebar with error handling"""
@@ -995,23 +1170,10 @@ def render_sidebar():
             try:
                 research_history = getattr(st.session_state, 'research_history', [])
                 if research_history:
-                    for idx, entry in enumerate(reversed(research_history[-3:])):
+                    for idx, entry in enumerate(itertools.islice(reversed(research_history), 3)):
                         with st.expander(f"Query {len(research_history) - idx}"):
                             st.markdown(f"**Query:** {entry.get('query', 'Unknown')[:50]}...")
-                            # Handle enhanced_galileo agent display
-                            if entry.get('enhanced_mode'):
-                                st.markdown(f"**Agents:** Enhanced Research Engine (Planner + Scout + Analyst + Writer)")
-                            else:
-                                try:
-                                    agent_names = []
-                                    for agent_id in entry.get('agents', []):
-                                        if 'AVAILABLE_AGENTS' in globals() and agent_id in AVAILABLE_AGENTS:
-                                            agent_names.append(AVAILABLE_AGENTS[agent_id]['name'])
-                                        else:
-                                            agent_names.append(agent_id.replace('_', ' ').title())
-                                    st.markdown(f"**Agents:** {', '.join(agent_names) if agent_names else 'None'}")
-                                except:
-                                    st.markdown(f"**Agents:** Unknown")
+                            st.markdown(f"**Agents:** {entry.get('agents_display', 'Unknown')}")
 
                             try:
                                 timestamp = entry.get('timestamp')
@@ -1068,6 +1230,9 @@ def main():
     """Main application"""
     initialize_session_state()
 
+    # Styles are re-sent every rerun (Streamlit drops elements that are not re-emitted), so keep the payload small
+    st.markdown(_minified_css(), unsafe_allow_html=True)
+
     # Header
     render_header()
 
@@ -1077,20 +1242,31 @@ def main():
 
     # Query interface
     render_query_interface()
+    progress_slot = st.empty()
+    if st.session_state.get('research_error'):
+        progress_slot.error(f"❌ Research failed: {st.session_state.pop('research_error')}")
+    elif st.session_state.research_job is not None and _research_progress_panel is not None:
+        with progress_slot.container():
+            _research_progress_panel()
 
     # Display latest results if available
     if st.session_state.research_history:
         latest = st.session_state.research_history[-1]
+        latest_result = get_result_store().get(latest['result_key'])
         st.markdown("---")
 
         # Check if it's enhanced mode or legacy mode
-        if latest.get('enhanced_mode'):
-            display_enhanced_research_results(latest['result'], latest['query'])
+        if latest_result is None:
+            st.info("ℹ️ The latest research results have expired. Run the query again to view them.")
+        elif latest.get('enhanced_mode'):
+            display_enhanced_research_results(latest_result, latest['query'], latest.get('session_key'),
+                                              latest.get('timestamp'))
         else:
             display_research_results(
-                latest['result'],
+                latest_result,
                 latest['query'],
-                latest['agents']
+                latest['agents'],
+                latest.get('timestamp')
             )
 
     # Sidebar
@@ -1100,5 +1276,9 @@ def main():
     st.markdown("---")
     st.markdown("*AI Research Workspace - Where Collaborative Intelligence Meets Beautiful Design* ✨")
 
+    # Background research job - polled last so the rest of the page stays rendered
+    if _research_progress_panel is None:
+        poll_research_job(progress_slot)
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
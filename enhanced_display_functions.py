@@ -3,18 +3,43 @@ Enhanced display functions for research results
 """
 
 import streamlit as st
+import functools
+import hashlib
 import re
+import time
 from datetime import datetime
-from typing import Dict, Any
-import io
-from reportlab.lib.pagesizes import A4
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, PageBreak
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.units import inch
-from reportlab.lib.colors import HexColor
+from typing import Dict, Any, List, Optional, Tuple
+import os
+from html import escape
+from collections import defaultdict
+from urllib.parse import urlparse
+
+# Inline markdown citations: [title](url)
+_CITATION_RE = re.compile(r'\[([^\]]+)\]\(([^)]+)\)')
+
+# Markdown line prefixes rendered with their own PDF style: "# ".."### ", "- "/"* ", "1."
+_LINE_RE = re.compile(r'(?P<heading>#{1,3}) |(?P<bullet>[-*]) |\d+\.')
+_HEADING_STYLE_NAMES = {1: 'heading', 2: 'sub_heading', 3: 'sub_sub_heading'}
+_NON_EMPTY_LINE_RE = re.compile(r'[^\n]+')
+
+# PDF renderer: "reportlab" (default) or "weasyprint", which renders the markdown report as HTML
+# and needs the optional `markdown` and `weasyprint` packages
+PDF_BACKEND = os.getenv("PDF_BACKEND", "reportlab").strip().lower()
+
+_WEASYPRINT_CSS = """
+@page { size: A4; margin: 72pt; }
+body { font-family: Helvetica, Arial, sans-serif; font-size: 11pt; line-height: 1.3; }
+h1, h2, h3 { color: #2c5282; }
+.title { color: #1f4e79; font-size: 24pt; text-align: center; }
+.query { color: #4a5568; font-size: 14pt; text-align: center; }
+.source-url { color: #666666; font-size: 9pt; }
+.footer { color: #888888; font-size: 10pt; text-align: center; page-break-before: always; }
+a { color: #0066cc; text-decoration: none; }
+"""
 
 
-def display_enhanced_research_results(result: Dict[str, Any], query: str):
+def display_enhanced_research_results(result: Dict[str, Any], query: str, session_key: Optional[str] = None,
+                                      generated_at: Optional[datetime] = None):
     """Display enhanced research results in horizontal layout"""
 
     if not result.get('success'):
@@ -26,11 +51,11 @@ def display_enhanced_research_results(result: Dict[str, Any], query: str):
     metadata = result.get('metadata', {})
     source_citation_map = result.get('source_citation_map', {})
 
-    # Create unique session keys to avoid duplicate key errors
-    import time
-    import hashlib
-    query_hash = hashlib.md5(query.encode()).hexdigest()[:8]
-    session_key = f"{int(time.time())}_{query_hash}"
+    # Create unique session keys to avoid duplicate key errors; callers that store
+    # results pass the key computed at storage time so it stays stable across reruns
+    if session_key is None:
+        query_hash = hashlib.md5(query.encode()).hexdigest()[:8]
+        session_key = f"{int(time.time())}_{query_hash}"
 
     # HORIZONTAL LAYOUT - Fixed columns with clear separation
     left_col, right_col = st.columns([7, 3], gap="large")
@@ -63,8 +88,10 @@ def display_enhanced_research_results(result: Dict[str, Any], query: str):
 
         # PDF Download
         try:
-            pdf_data = generate_enhanced_pdf_report(result, query)
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            if generated_at is None:
+                generated_at = datetime.now()
+            pdf_data = generate_enhanced_pdf_report(result, query, generated_at)
+            timestamp = generated_at.strftime("%Y%m%d_%H%M%S")
             pdf_filename = f"research_report_{timestamp}.pdf"
 
             st.download_button(
@@ -100,29 +127,151 @@ def display_enhanced_research_results(result: Dict[str, Any], query: str):
     return
 
 
+@st.cache_data(max_entries=64)
 def process_citations_for_streamlit(markdown_text: str) -> str:
     """Process inline citations to work better with Streamlit"""
 
     # Convert markdown citations to HTML links for better display
-    citation_pattern = r'\[([^\]]+)\]\(([^)]+)\)'
+    processed_text = _CITATION_RE.sub(
+        r'<a href="\2" target="_blank" style="color: #0066cc; text-decoration: none;">[\1]</a>',
+        markdown_text
+    )
 
-    def replace_citation(match):
-        title = match.group(1)
-        url = match.group(2)
-        return f'<a href="{url}" target="_blank" style="color: #0066cc; text-decoration: none;">[{title}]</a>'
+    return processed_text
 
-    processed_text = re.sub(citation_pattern, replace_citation, markdown_text)
 
-    return processed_text
+@functools.lru_cache(maxsize=4096)
+def _url_netloc(url: str) -> str:
+    """Domain of a source URL; memoized because the same sources recur across reports"""
+    return urlparse(url).netloc
 
 
-def generate_enhanced_pdf_report(result: Dict[str, Any], query: str) -> bytes:
+def _group_sources_by_domain(source_citation_map: Dict[str, Any]) -> Dict[str, List[Tuple[str, Any]]]:
+    """Group (url, data) pairs from the citation map by their domain"""
+    domain_sources = defaultdict(list)
+    for url, data in source_citation_map.items():
+        try:
+            domain_sources[_url_netloc(url) or '(unknown)'].append((url, data))
+        except Exception:
+            pass
+    return domain_sources
+
+
+class _PDFSink:
+    """Write-only file object for doc.build that keeps the written bytes objects as-is"""
+
+    __slots__ = ('_chunks',)
+
+    def __init__(self):
+        self._chunks = []
+
+    def write(self, data: bytes) -> int:
+        self._chunks.append(data)
+        return len(data)
+
+    def getvalue(self) -> bytes:
+        # The usual single write is returned without a copy
+        return self._chunks[0] if len(self._chunks) == 1 else b"".join(self._chunks)
+
+
+@functools.lru_cache(maxsize=None)
+def _pdf_styles() -> Dict[str, Any]:
+    """Paragraph styles for the enhanced PDF report, built once per process"""
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+    from reportlab.lib.colors import HexColor
+
+    styles = getSampleStyleSheet()
+
+    title_style = ParagraphStyle(
+        'EnhancedTitle',
+        parent=styles['Heading1'],
+        fontSize=24,
+        spaceAfter=30,
+        textColor=HexColor('#1f4e79'),
+        alignment=1,  # Center
+        fontName='Helvetica-Bold'
+    )
+
+    heading_style = ParagraphStyle(
+        'EnhancedHeading',
+        parent=styles['Heading2'],
+        fontSize=16,
+        spaceAfter=12,
+        textColor=HexColor('#2c5282'),
+        spaceBefore=20,
+        fontName='Helvetica-Bold'
+    )
+
+    normal_style = ParagraphStyle(
+        'EnhancedNormal',
+        parent=styles['Normal'],
+        fontSize=11,
+        spaceAfter=12,
+        leading=14,
+        fontName='Helvetica'
+    )
+
+    citation_style = ParagraphStyle(
+        'CitationStyle',
+        parent=styles['Normal'],
+        fontSize=10,
+        spaceAfter=8,
+        leading=12,
+        leftIndent=20,
+        fontName='Helvetica',
+        textColor=HexColor('#666666')
+    )
+
+    return {
+        'title': title_style,
+        'heading': heading_style,
+        'normal': normal_style,
+        'citation': citation_style,
+        'query': ParagraphStyle('QueryStyle', parent=normal_style, fontSize=14,
+                                textColor=HexColor('#4a5568'), alignment=1),
+        'footer': ParagraphStyle('Footer', parent=normal_style, fontSize=10,
+                                 textColor=HexColor('#888888'), alignment=1),
+        'sub_heading': ParagraphStyle('SubHeading', parent=heading_style, fontSize=14),
+        'sub_sub_heading': ParagraphStyle('SubSubHeading', parent=heading_style, fontSize=12),
+        'list_item': ParagraphStyle('ListItem', parent=normal_style, leftIndent=20),
+        'numbered_item': ParagraphStyle('NumberedItem', parent=normal_style, leftIndent=20),
+    }
+
+
+def generate_enhanced_pdf_report(result: Dict[str, Any], query: str,
+                                 generated_at: Optional[datetime] = None) -> bytes:
     """Generate enhanced PDF report with proper citations and links"""
+    # Only the fields the PDF renders form the cache key, not the whole result dict;
+    # the stamp is the result's own time, so cached bytes never show a stale "now"
+    return _build_pdf(
+        query,
+        result.get('markdown_report', ''),
+        tuple(sorted(result.get('metadata', {}).items())),
+        tuple(result.get('source_citation_map', {}).items()),
+        generated_at or datetime.now()
+    )
+
+
+@st.cache_data(max_entries=16, show_spinner=False)
+def _build_pdf(query: str, markdown_report: str, metadata_items: tuple, source_items: tuple,
+               generated_at: datetime) -> bytes:
+    """Build the PDF bytes; cached so reruns reuse them until the report changes"""
+    metadata = dict(metadata_items)
+    source_citation_map = dict(source_items)
+
+    if PDF_BACKEND == 'weasyprint':
+        pdf_data = _render_pdf_with_weasyprint(query, markdown_report, metadata, source_citation_map, generated_at)
+        if pdf_data is not None:
+            return pdf_data
+
+    # reportlab is only imported once a PDF is actually requested
+    from reportlab.lib.pagesizes import A4
+    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, PageBreak
 
     try:
-        # Create PDF buffer
-        buffer = io.BytesIO()
-
+        # reportlab renders the whole file to bytes before its single write, so keeping that
+        # object (rather than copying it into and back out of a BytesIO) holds the PDF once
+        buffer = _PDFSink()
         # Create PDF document
         doc = SimpleDocTemplate(
             buffer,
@@ -133,68 +282,25 @@ def generate_enhanced_pdf_report(result: Dict[str, Any], query: str) -> bytes:
             bottomMargin=72
         )
 
-        # Enhanced styles
-        styles = getSampleStyleSheet()
-
-        title_style = ParagraphStyle(
-            'EnhancedTitle',
-            parent=styles['Heading1'],
-            fontSize=24,
-            spaceAfter=30,
-            textColor=HexColor('#1f4e79'),
-            alignment=1,  # Center
-            fontName='Helvetica-Bold'
-        )
-
-        heading_style = ParagraphStyle(
-            'EnhancedHeading',
-            parent=styles['Heading2'],
-            fontSize=16,
-            spaceAfter=12,
-            textColor=HexColor('#2c5282'),
-            spaceBefore=20,
-            fontName='Helvetica-Bold'
-        )
-
-        normal_style = ParagraphStyle(
-            'EnhancedNormal',
-            parent=styles['Normal'],
-            fontSize=11,
-            spaceAfter=12,
-            leading=14,
-            fontName='Helvetica'
-        )
-
-        citation_style = ParagraphStyle(
-            'CitationStyle',
-            parent=styles['Normal'],
-            fontSize=10,
-            spaceAfter=8,
-            leading=12,
-            leftIndent=20,
-            fontName='Helvetica',
-            textColor=HexColor('#666666')
-        )
+        # Enhanced styles (built once per process)
+        styles = _pdf_styles()
+        title_style = styles['title']
+        heading_style = styles['heading']
+        normal_style = styles['normal']
+        citation_style = styles['citation']
 
         # Build PDF content
         story = []
 
-        # Get data
-        markdown_report = result.get('markdown_report', '')
-        metadata = result.get('metadata', {})
-        source_citation_map = result.get('source_citation_map', {})
-
         # Title page
         story.append(Paragraph(f"AI Research Report", title_style))
         story.append(Spacer(1, 20))
-        story.append(Paragraph(f"{query}",
-            ParagraphStyle('QueryStyle', parent=normal_style, fontSize=14,
-                          textColor=HexColor('#4a5568'), alignment=1)))
+        story.append(Paragraph(f"{query}", styles['query']))
         story.append(Spacer(1, 30))
 
         # Metadata section
         story.append(Paragraph("Report Metadata", heading_style))
-        story.append(Paragraph(f"<b>Generated:</b> {datetime.now().strftime('%B %d, %Y at %I:%M %p')}", normal_style))
+        story.append(Paragraph(f"<b>Generated:</b> {generated_at.strftime('%B %d, %Y at %I:%M %p')}", normal_style))
         story.append(Paragraph(f"<b>Research Engine:</b> Enhanced AI Research System", normal_style))
         story.append(Paragraph(f"<b>Word Count:</b> {metadata.get('word_count', 0)} words", normal_style))
         story.append(Paragraph(f"<b>Citations:</b> {metadata.get('citation_count', 0)} inline citations", normal_style))
@@ -204,7 +310,7 @@ def generate_enhanced_pdf_report(result: Dict[str, Any], query: str) -> bytes:
         # Main report content
         if markdown_report:
             # Convert markdown to PDF-friendly format
-            pdf_content = convert_markdown_to_pdf_content(markdown_report, heading_style, normal_style)
+            pdf_content = convert_markdown_to_pdf_content(markdown_report)
             story.extend(pdf_content)
 
         # Comprehensive source listing
@@ -216,18 +322,7 @@ def generate_enhanced_pdf_report(result: Dict[str, Any], query: str) -> bytes:
             story.append(Spacer(1, 15))
 
             # Group sources by domain for better organization
-            domain_sources = {}
-            for url, data in source_citation_map.items():
-                try:
-                    from urllib.parse import urlparse
-                    domain = urlparse(url).netloc
-                    if domain not in domain_sources:
-                        domain_sources[domain] = []
-                    domain_sources[domain].append((url, data))
-                except:
-                    pass
-
-            for domain, sources in domain_sources.items():
+            for domain, sources in _group_sources_by_domain(source_citation_map).items():
                 story.append(Paragraph(f"<b>{domain}</b> ({len(sources)} sources)", heading_style))
 
                 for j, (url, data) in enumerate(sources, 1):
@@ -243,67 +338,110 @@ def generate_enhanced_pdf_report(result: Dict[str, Any], query: str) -> bytes:
 
         # Footer
         story.append(PageBreak())
-        story.append(Paragraph("Generated by Enhanced AI Research Engine",
-            ParagraphStyle('Footer', parent=normal_style, fontSize=10,
-                          textColor=HexColor('#888888'), alignment=1)))
+        story.append(Paragraph("Generated by Enhanced AI Research Engine", styles['footer']))
 
         # Build PDF
         doc.build(story)
 
-        # Get PDF data
-        pdf_data = buffer.getvalue()
-        buffer.close()
-
-        return pdf_data
+        return buffer.getvalue()
 
     except Exception as e:
         raise Exception(f"Enhanced PDF generation failed: {str(e)}")
 
 
-def convert_markdown_to_pdf_content(markdown_text: str, heading_style, normal_style):
+def _render_pdf_with_weasyprint(query: str, markdown_report: str, metadata: Dict[str, Any],
+                                source_citation_map: Dict[str, Any], generated_at: datetime):
+    """Render the report through markdown -> HTML -> WeasyPrint; None if the backend is unusable"""
+    try:
+        import markdown
+        from weasyprint import HTML
+    except (ImportError, OSError) as e:  # OSError: WeasyPrint's Pango/GObject libraries are missing
+        print(f"⚠️ PDF_BACKEND=weasyprint but it cannot be loaded ({e}); using reportlab")
+        return None
+
+    html_parts = [
+        f"<html><head><meta charset='utf-8'><style>{_WEASYPRINT_CSS}</style></head><body>",
+        "<h1 class='title'>AI Research Report</h1>",
+        f"<p class='query'>{escape(query)}</p>",
+        "<h2>Report Metadata</h2>",
+        f"<p><b>Generated:</b> {generated_at.strftime('%B %d, %Y at %I:%M %p')}<br/>"
+        f"<b>Research Engine:</b> Enhanced AI Research System<br/>"
+        f"<b>Word Count:</b> {metadata.get('word_count', 0)} words<br/>"
+        f"<b>Citations:</b> {metadata.get('citation_count', 0)} inline citations<br/>"
+        f"<b>Sources Analyzed:</b> {metadata.get('sources_analyzed', 0)} sources</p>",
+    ]
+
+    if markdown_report:
+        # The report is LLM output built from scraped pages, so any raw HTML in it is shown as text
+        html_parts.append(markdown.markdown(markdown_report.replace('<', '&lt;'), extensions=['extra']))
+
+    html_parts.append("<h2 style='page-break-before: always;'>Complete Source Bibliography</h2>")
+    if source_citation_map:
+        html_parts.append(f"<p>Total sources with inline citations: {len(source_citation_map)}</p>")
+        for domain, sources in _group_sources_by_domain(source_citation_map).items():
+            html_parts.append(f"<h3>{escape(domain)} ({len(sources)} sources)</h3><ol>")
+            for url, data in sources:
+                html_parts.append(
+                    f"<li><a href=\"{escape(url)}\">{escape(data.get('title', 'Unknown Source'))}</a><br/>"
+                    f"<span class='source-url'>{escape(url)}</span></li>"
+                )
+            html_parts.append("</ol>")
+
+    html_parts.append("<p class='footer'>Generated by Enhanced AI Research Engine</p></body></html>")
+
+    try:
+        return HTML(string="".join(html_parts), url_fetcher=_refuse_url_fetch).write_pdf()
+    except Exception as e:
+        print(f"⚠️ WeasyPrint rendering failed ({e}); using reportlab")
+        return None
+
+
+def _refuse_url_fetch(url: str, *args, **kwargs):
+    """WeasyPrint url_fetcher that loads nothing"""
+    # Report images/stylesheets must not reach file:// paths or internal hosts; links stay
+    # clickable because WeasyPrint never fetches them
+    raise ValueError(f"External resources are not loaded into PDF reports: {url}")
+
+
+def convert_markdown_to_pdf_content(markdown_text: str):
     """Convert markdown text to PDF-friendly content with proper formatting"""
+    from reportlab.platypus import Paragraph, Spacer
 
+    styles = _pdf_styles()
     story = []
-    lines = markdown_text.split('\n')
 
-    for line in lines:
-        line = line.strip()
-        if not line:
-            continue
+    for style_name, text in _parse_markdown_for_pdf(markdown_text):
+        story.append(Paragraph(text, styles[style_name]))
+        # A fresh Spacer per gap: reportlab marks a flowable postponed when it misses a page
+        # bottom, and raises LayoutError if that same instance misses another one
+        story.append(Spacer(1, 6))
 
-        # Handle headers
-        if line.startswith('# '):
-            story.append(Paragraph(line[2:], heading_style))
-        elif line.startswith('## '):
-            story.append(Paragraph(line[3:],
-                ParagraphStyle('SubHeading', parent=heading_style, fontSize=14)))
-        elif line.startswith('### '):
-            story.append(Paragraph(line[4:],
-                ParagraphStyle('SubSubHeading', parent=heading_style, fontSize=12)))
-
-        # Handle lists
-        elif line.startswith('- ') or line.startswith('* '):
-            story.append(Paragraph(f"• {line[2:]}",
-                ParagraphStyle('ListItem', parent=normal_style, leftIndent=20)))
-
-        # Handle numbered lists
-        elif re.match(r'^\d+\.', line):
-            story.append(Paragraph(line,
-                ParagraphStyle('NumberedItem', parent=normal_style, leftIndent=20)))
-
-        # Regular paragraphs with citation support
-        else:
-            # Convert inline citations to proper links
-            citation_pattern = r'\[([^\]]+)\]\(([^)]+)\)'
+    return story
 
-            def replace_citation(match):
-                title = match.group(1)
-                url = match.group(2)
-                return f'<link href="{url}">[{title}]</link>'
 
-            processed_line = re.sub(citation_pattern, replace_citation, line)
-            story.append(Paragraph(processed_line, normal_style))
+@st.cache_data(max_entries=64)
+def _parse_markdown_for_pdf(markdown_text: str) -> List[Tuple[str, str]]:
+    """Parse markdown into (style name, paragraph markup) pairs for the PDF story"""
 
-        story.append(Spacer(1, 6))
+    blocks = []
+
+    # Stream lines straight out of the report instead of materializing split('\n')
+    for line_match in _NON_EMPTY_LINE_RE.finditer(markdown_text):
+        line = line_match.group().strip()
+        if not line:
+            continue
+
+        # One regex step classifies headers, bullets and numbered items
+        match = _LINE_RE.match(line)
+        if match is None:
+            # Regular paragraphs with citation support
+            processed_line = _CITATION_RE.sub(r'<link href="\2">[\1]</link>', line)
+            blocks.append(('normal', processed_line))
+        elif match.group('heading'):
+            blocks.append((_HEADING_STYLE_NAMES[len(match.group('heading'))], line[match.end():]))
+        elif match.group('bullet'):
+            blocks.append(('list_item', f"• {line[match.end():]}"))
+        else:
+            blocks.append(('numbered_item', line))
 
-    return story
\ No newline at end of file
+    return blocks
@@ -0,0 +1,160 @@
+"""
+Base Agent - Shared research flow for the specialized agents
+Subclasses only declare their profile and insight rules
+"""
+
+from typing import Dict, List, Any, Optional, Tuple
+from datetime import datetime
+from collections import deque
+import asyncio
+import time
+
+from ..core.keyword_matcher import KeywordMatcher
+from ..core.result_cache import ResultCache, normalize_query
+
+# Raw engine results shared by every agent, keyed on (agent id, normalized focused query);
+# the focused query already folds in any context, so identical requests skip the pipeline
+# for an hour, matching the collaboration manager's cache
+AGENT_RESULT_CACHE = ResultCache(max_entries=256, ttl_seconds=3600)
+
+def format_timestamp_ns(timestamp_ns: int) -> str:
+    """ISO string for a time.time_ns() stamp; history entries are only formatted when read"""
+    return datetime.fromtimestamp(timestamp_ns / 1_000_000_000).isoformat()
+
+def format_agent_context(context: Dict) -> str:
+    """Enhanced-query block listing the first two key points each other agent reported"""
+    lines = "".join(
+        f"\n{agent_id}: {', '.join(insights['key_points'][:2])}"
+        for agent_id, insights in context.items()
+        if isinstance(insights, dict) and insights.get("key_points")
+    )
+    return f"\n\nContext from other research agents:{lines}"
+
+def load_default_engine():
+    """Import the research engine (and its HTTP/LLM dependencies) only when first needed"""
+    from ..core.research_engine import get_default_engine
+    return get_default_engine()
+
+class BaseAgent:
+    """
+    Data-driven research agent
+
+    Subclasses set the profile attributes below as class attributes; `insight_rules` is a
+    tuple of (insight label, terms) pairs and each rule fires when any of its terms occurs
+    in the lowercased analysis.
+    """
+
+    __slots__ = ("research_engine", "research_history")
+
+    agent_id: str = ""
+    name: str = ""
+    icon: str = ""
+    specialty: str = ""
+    description: str = ""
+    capabilities: List[str] = []
+    keywords: List[str] = []
+    example_queries: Optional[List[str]] = None
+
+    # Appended to the user's query to steer the research engine
+    query_focus: str = ""
+    # Result key the extracted insights are stored under
+    insights_key: str = "insights"
+    insight_rules: Tuple[Tuple[str, Tuple[str, ...]], ...] = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # All rules share one matcher, so the analysis is scanned once regardless of rule count
+        rules_by_term = {}
+        for index, (_, terms) in enumerate(cls.insight_rules):
+            for term in terms:
+                rules_by_term.setdefault(term, set()).add(index)
+        cls._rules_by_term = rules_by_term
+        cls._insight_matcher = KeywordMatcher(rules_by_term)
+
+    def __init__(self):
+        self.research_engine = None  # Resolved on first research() call
+        self.research_history = deque(maxlen=10)  # Only the most recent queries are kept
+
+    def research(self, query: str, context: Optional[Dict] = None) -> Dict[str, Any]:
+        print(f"{self.icon} {self.name} analyzing: {query}")
+
+        result = self._cached_research(self._enhance_query(query, context))
+        return self._record(query, self._post_process(result, query))
+
+    async def research_async(self, query: str, context: Optional[Dict] = None) -> Dict[str, Any]:
+        """
+        research() with the blocking engine call moved to a worker thread
+
+        Lets a coordinator asyncio.gather() several agents so wall time is the slowest
+        agent rather than the sum; post-processing stays on the event loop.
+        """
+        print(f"{self.icon} {self.name} analyzing: {query}")
+
+        result = await asyncio.to_thread(self._cached_research, self._enhance_query(query, context))
+        return self._record(query, self._post_process(result, query))
+
+    def _record(self, query: str, result: Dict[str, Any]) -> Dict[str, Any]:
+        self.research_history.append({
+            "query": query,
+            "result": result,
+            "timestamp_ns": time.time_ns()
+        })
+        return result
+
+    def _cached_research(self, focused_query: str) -> Dict[str, Any]:
+        """Run the engine, reusing a fresh copy of an earlier identical result when cached"""
+        return AGENT_RESULT_CACHE.get_or_compute(
+            (self.agent_id, normalize_query(focused_query)),
+            lambda: self._get_engine().comprehensive_research(focused_query, self.agent_id)
+        )
+
+    def _get_engine(self):
+        """Shared research engine, imported on first use so get_info() stays import-light"""
+        if self.research_engine is None:
+            self.research_engine = load_default_engine()
+        return self.research_engine
+
+    def _enhance_query(self, query: str, context: Optional[Dict] = None) -> str:
+        """Focus the query on this agent's specialty"""
+        return f"{query} {self.query_focus}"
+
+    def _post_process(self, result: Dict[str, Any], original_query: str) -> Dict[str, Any]:
+        """Tag the result with the agent type and its specialty insights"""
+        result.update({
+            "agent_type": self.agent_id,
+            self.insights_key: self._extract_insights(result)
+        })
+        return result
+
+    def _extract_insights(self, result: Dict[str, Any]) -> List[str]:
+        analysis = result.get("analysis", "").lower()
+        fired = set()
+        for term in self._insight_matcher.found(analysis):
+            fired.update(self._rules_by_term[term])
+        return [label for index, (label, _) in enumerate(self.insight_rules) if index in fired]
+
+    def get_info(self) -> Dict[str, Any]:
+        info = {
+            "agent_id": self.agent_id,
+            "name": self.name,
+            "icon": self.icon,
+            "specialty": self.specialty,
+            "description": self.description,
+            "capabilities": self.capabilities,
+            "keywords": self.keywords,
+        }
+        if self.example_queries is not None:
+            info["example_queries"] = self.example_queries
+        info.update({
+            "research_count": len(self.research_history),
+            "status": "🟢 Ready"
+        })
+        return info
+
+    def get_research_history(self) -> List[Dict[str, Any]]:
+        """Get research history"""
+        return [  # Last 10 research queries
+            {"query": entry["query"], "result": entry["result"],
+             "timestamp": format_timestamp_ns(entry["timestamp_ns"])}
+            for entry in self.research_history
+        ]
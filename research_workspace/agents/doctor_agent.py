@@ -4,182 +4,182 @@ Clean, simple implementation focused on medical research
 """
 
 from typing import Dict, List, Any, Optional
-from datetime import datetime
-import sys
-import os
-
-# Add path for core components
-sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
-from core.research_engine import RealResearchEngine
-
-class DoctorAgent:
+from collections import Counter
+import bisect
+import itertools
+import re
+
+from .base import BaseAgent, format_agent_context
+from ..core.keyword_matcher import KeywordMatcher
+from ..core.domain_match import DomainSet
+
+# Vocabulary the medical assessors look for in sources and analysis text
+# Brand entries match hostname labels by prefix (cochranelibrary, mayoclinic, jamanetwork);
+# thelancet.com is listed on its own since its label doesn't start with the brand
+_MEDICAL_DOMAINS = DomainSet([
+    "pubmed", "nejm", "bmj", "lancet", "thelancet", "jama", "mayo",
+    "who.int", "cdc.gov", "nih.gov", "fda.gov", "medscape", "uptodate",
+    "cochrane", "clinicaltrials.gov"
+])
+
+_MEDICAL_TERMS = (
+    "clinical", "patient", "treatment", "therapy", "drug", "medication",
+    "diagnosis", "symptom", "efficacy", "safety", "side effect", "adverse"
+)
+
+# Single words count every token they start ("patients", "symptoms", "clinically") but not
+# tokens that merely contain them ("asymptomatic"); none of them is a prefix of another
+_MEDICAL_WORDS = tuple(term for term in _MEDICAL_TERMS if " " not in term)
+_MEDICAL_PHRASES = tuple(term for term in _MEDICAL_TERMS if " " in term)
+
+# Word tokens for the term-density metrics; hyphenated words ("double-blind") stay whole
+_WORD_RE = re.compile(r"[a-z][a-z-]*")
+
+_EVIDENCE_LEVELS = {
+    "level_1": ("systematic review", "meta-analysis", "cochrane"),
+    "level_2": ("randomized controlled trial", "rct", "double-blind"),
+    "level_3": ("cohort study", "case-control", "observational"),
+    "level_4": ("case series", "case report", "expert opinion")
+}
+
+# Best evidence level present decides the quality band
+_EVIDENCE_QUALITY = (("level_1", "High"), ("level_2", "Good"), ("level_3", "Moderate"))
+
+# Mention counts strictly above each threshold move up one band (bisect_left)
+_MENTION_THRESHOLDS = (1, 3)
+_SAFETY_LABELS = ("Limited", "Moderate", "Comprehensive")
+_EFFICACY_LABELS = ("Limited", "Moderate", "Strong")
+
+_SAFETY_INDICATORS = (
+    "side effect", "adverse event", "contraindication", "warning",
+    "precaution", "risk", "safety", "toxicity", "allergic reaction"
+)
+
+_EFFICACY_INDICATORS = (
+    "efficacy", "effective", "improvement", "benefit", "outcome",
+    "response rate", "success rate", "cure", "remission"
+)
+
+_REGULATORY_TERMS = (
+    "fda approved", "fda approval", "approved by", "licensed",
+    "regulatory", "clinical trial", "phase", "investigational"
+)
+
+_GUIDELINE_TERMS = ("guideline", "recommendation", "standard of care")
+
+# Fixed parts of the enhanced query; only the user query and context vary per call
+_MEDICAL_FOCUS_SUFFIX = " medical research clinical study treatment"
+_MEDICAL_FOCUS_FOOTER = "\n\nFocus on: clinical evidence, medical journals, treatment guidelines, safety data, efficacy studies"
+
+# Every analysis term above (plus the single-term checks in the assessors) in one automaton
+_ANALYSIS_MATCHER = KeywordMatcher(itertools.chain(
+    _MEDICAL_TERMS, itertools.chain.from_iterable(_EVIDENCE_LEVELS.values()),
+    _SAFETY_INDICATORS, _EFFICACY_INDICATORS, _REGULATORY_TERMS, _GUIDELINE_TERMS,
+    ("adverse",)
+))
+
+class DoctorAgent(BaseAgent):
     """
     Specialized agent for medical and healthcare research
     """
 
-    def __init__(self):
-        self.agent_id = "doctor"
-        self.name = "Doctor Agent"
-        self.icon = "🏥"
-        self.specialty = "Medical and healthcare research"
-        self.description = "Focuses on medical research, clinical studies, healthcare trends, and medical analysis"
-
-        self.capabilities = [
-            "Medical condition research and analysis",
-            "Treatment option evaluation",
-            "Clinical study interpretation",
-            "Drug and therapy research",
-            "Healthcare trend analysis",
-            "Medical guideline review",
-            "Symptom and diagnosis research",
-            "Medical safety and efficacy assessment"
-        ]
-
-        self.keywords = [
-            "medical", "health", "doctor", "clinical", "treatment", "disease",
-            "medicine", "therapy", "patient", "diagnosis", "symptoms", "drug",
-            "healthcare", "hospital", "physician", "nursing"
-        ]
-
-        self.example_queries = [
-            "Latest treatments for Type 2 diabetes",
-            "Clinical evidence for new cancer therapies",
-            "Side effects of common blood pressure medications",
-            "Best practices for mental health treatment"
-        ]
-
-        # Initialize research engine
-        self.research_engine = RealResearchEngine()
-        self.research_history = []
-
-    def research(self, query: str, context: Optional[Dict] = None) -> Dict[str, Any]:
-        """
-        Perform medical research with clinical focus
-
-        Args:
-            query: Medical research question
-            context: Optional context from other agents
-
-        Returns:
-            Comprehensive medical research results
-        """
-
-        print(f"🏥 Doctor Agent analyzing: {query}")
-
-        # Enhance query for medical focus
-        medical_query = self._enhance_for_medical_research(query, context)
-
-        # Perform comprehensive research with medical analysis
-        result = self.research_engine.comprehensive_research(medical_query, "doctor")
-
-        # Add medical-specific post-processing
-        enhanced_result = self._add_medical_analysis(result, query)
-
-        # Store in history
-        self.research_history.append({
-            "query": query,
-            "result": enhanced_result,
-            "timestamp": datetime.now().isoformat()
-        })
-
-        return enhanced_result
-
-    def _enhance_for_medical_research(self, query: str, context: Optional[Dict] = None) -> str:
+    __slots__ = ()
+
+    agent_id = "doctor"
+    name = "Doctor Agent"
+    icon = "🏥"
+    specialty = "Medical and healthcare research"
+    description = "Focuses on medical research, clinical studies, healthcare trends, and medical analysis"
+
+    capabilities = [
+        "Medical condition research and analysis",
+        "Treatment option evaluation",
+        "Clinical study interpretation",
+        "Drug and therapy research",
+        "Healthcare trend analysis",
+        "Medical guideline review",
+        "Symptom and diagnosis research",
+        "Medical safety and efficacy assessment"
+    ]
+
+    keywords = [
+        "medical", "health", "doctor", "clinical", "treatment", "disease",
+        "medicine", "therapy", "patient", "diagnosis", "symptoms", "drug",
+        "healthcare", "hospital", "physician", "nursing"
+    ]
+
+    example_queries = [
+        "Latest treatments for Type 2 diabetes",
+        "Clinical evidence for new cancer therapies",
+        "Side effects of common blood pressure medications",
+        "Best practices for mental health treatment"
+    ]
+
+    def _enhance_query(self, query: str, context: Optional[Dict] = None) -> str:
         """Enhance query with medical research focus"""
 
-        enhanced_parts = []
-
-        # Add medical search terms
-        enhanced_parts.append(f"{query} medical research clinical study treatment")
-
-        # Add context if available
-        if context:
-            enhanced_parts.append("\nContext from other research agents:")
-            for agent_id, insights in context.items():
-                if isinstance(insights, dict) and insights.get("key_points"):
-                    enhanced_parts.append(f"{agent_id}: {', '.join(insights['key_points'][:2])}")
+        # The context block is only built when other agents passed context
+        context_block = format_agent_context(context) if context else ""
+        return f"{query}{_MEDICAL_FOCUS_SUFFIX}{context_block}{_MEDICAL_FOCUS_FOOTER}"
 
-        # Add medical focus
-        enhanced_parts.append("\nFocus on: clinical evidence, medical journals, treatment guidelines, safety data, efficacy studies")
-
-        return "\n".join(enhanced_parts)
-
-    def _add_medical_analysis(self, result: Dict[str, Any], original_query: str) -> Dict[str, Any]:
+    def _post_process(self, result: Dict[str, Any], original_query: str) -> Dict[str, Any]:
         """Add medical-specific analysis to research results"""
 
+        # Lowercase and scan the analysis once; every assessor reads the same term counts
+        analysis_lower = result.get("analysis", "").lower()
+        term_counts = _ANALYSIS_MATCHER.counts(analysis_lower)
+
         # Enhanced medical metrics
-        medical_metrics = self._calculate_medical_metrics(result)
+        medical_metrics = self._calculate_medical_metrics(result, analysis_lower, term_counts)
 
         # Add medical-specific fields
         result.update({
             "agent_type": "doctor",
             "medical_metrics": medical_metrics,
-            "clinical_evidence": self._assess_clinical_evidence(result),
-            "safety_profile": self._assess_safety_profile(result),
-            "efficacy_data": self._assess_efficacy_data(result),
-            "regulatory_status": self._assess_regulatory_status(result),
-            "medical_insights": self._extract_medical_insights(result)
+            "clinical_evidence": self._assess_clinical_evidence(term_counts),
+            "safety_profile": self._assess_safety_profile(term_counts),
+            "efficacy_data": self._assess_efficacy_data(term_counts),
+            "regulatory_status": self._assess_regulatory_status(term_counts),
+            "medical_insights": self._extract_medical_insights(result, term_counts)
         })
 
         return result
 
-    def _calculate_medical_metrics(self, result: Dict[str, Any]) -> Dict[str, Any]:
+    def _calculate_medical_metrics(self, result: Dict[str, Any], analysis_lower: str,
+                                   term_counts: Counter) -> Dict[str, Any]:
         """Calculate medical-specific metrics"""
 
         sources = result.get("sources", [])
-        analysis = result.get("analysis", "")
 
         # Count medical sources
-        medical_domains = [
-            "pubmed", "nejm", "bmj", "lancet", "jama", "mayo", "who.int",
-            "cdc.gov", "nih.gov", "fda.gov", "medscape", "uptodate",
-            "cochrane", "clinicaltrials.gov"
-        ]
+        medical_source_count = sum(1 for source in sources if _MEDICAL_DOMAINS.matches(source))
 
-        medical_source_count = 0
-        for source in sources:
-            if any(domain in source.lower() for domain in medical_domains):
-                medical_source_count += 1
-
-        # Count medical-specific terms
-        medical_terms = [
-            "clinical", "patient", "treatment", "therapy", "drug", "medication",
-            "diagnosis", "symptom", "efficacy", "safety", "side effect", "adverse"
-        ]
-
-        medical_term_count = sum(analysis.lower().count(term) for term in medical_terms)
+        # Count medical-specific terms: word stems from one tokenization, phrases from the scan
+        words = _WORD_RE.findall(analysis_lower)
+        medical_term_count = (
+            sum(count for word, count in Counter(words).items() if word.startswith(_MEDICAL_WORDS)) +
+            sum(term_counts[phrase] for phrase in _MEDICAL_PHRASES)
+        )
 
         return {
             "total_sources": len(sources),
             "medical_sources": medical_source_count,
             "medical_source_ratio": medical_source_count / len(sources) if sources else 0,
-            "medical_term_density": medical_term_count / len(analysis.split()) if analysis else 0,
+            "medical_term_density": medical_term_count / len(words) if words else 0,
             "clinical_indicators": medical_term_count
         }
 
-    def _assess_clinical_evidence(self, result: Dict[str, Any]) -> Dict[str, Any]:
+    def _assess_clinical_evidence(self, term_counts: Counter) -> Dict[str, Any]:
         """Assess quality of clinical evidence"""
 
-        analysis = result.get("analysis", "").lower()
-
-        evidence_levels = {
-            "level_1": ["systematic review", "meta-analysis", "cochrane"],
-            "level_2": ["randomized controlled trial", "rct", "double-blind"],
-            "level_3": ["cohort study", "case-control", "observational"],
-            "level_4": ["case series", "case report", "expert opinion"]
+        evidence_counts = {
+            level: sum(1 for term in terms if term in term_counts)
+            for level, terms in _EVIDENCE_LEVELS.items()
         }
 
-        evidence_counts = {level: 0 for level in evidence_levels}
-
-        for level, terms in evidence_levels.items():
-            for term in terms:
-                if term in analysis:
-                    evidence_counts[level] += 1
-
-        evidence_quality = "High" if evidence_counts["level_1"] > 0 else \
-                          "Good" if evidence_counts["level_2"] > 0 else \
-                          "Moderate" if evidence_counts["level_3"] > 0 else \
-                          "Limited"
+        evidence_quality = next(
+            (quality for level, quality in _EVIDENCE_QUALITY if evidence_counts[level] > 0), "Limited"
+        )
 
         return {
             "evidence_levels": evidence_counts,
@@ -188,82 +188,57 @@ class DoctorAgent:
             "has_rct_data": evidence_counts["level_2"] > 0
         }
 
-    def _assess_safety_profile(self, result: Dict[str, Any]) -> Dict[str, Any]:
+    def _assess_safety_profile(self, term_counts: Counter) -> Dict[str, Any]:
         """Assess safety information from research"""
 
-        analysis = result.get("analysis", "").lower()
-
-        safety_indicators = [
-            "side effect", "adverse event", "contraindication", "warning",
-            "precaution", "risk", "safety", "toxicity", "allergic reaction"
-        ]
-
-        safety_mentions = sum(1 for indicator in safety_indicators if indicator in analysis)
+        safety_mentions = sum(1 for indicator in _SAFETY_INDICATORS if indicator in term_counts)
 
         safety_concerns = []
-        if "side effect" in analysis or "adverse" in analysis:
+        if "side effect" in term_counts or "adverse" in term_counts:
             safety_concerns.append("Side effects documented")
-        if "contraindication" in analysis:
+        if "contraindication" in term_counts:
             safety_concerns.append("Contraindications noted")
-        if "warning" in analysis or "risk" in analysis:
+        if "warning" in term_counts or "risk" in term_counts:
             safety_concerns.append("Safety warnings identified")
 
         return {
             "safety_mentions": safety_mentions,
             "safety_concerns": safety_concerns,
             "safety_data_available": safety_mentions > 0,
-            "safety_assessment": "Comprehensive" if safety_mentions > 3 else
-                                "Moderate" if safety_mentions > 1 else
-                                "Limited"
+            "safety_assessment": _SAFETY_LABELS[bisect.bisect_left(_MENTION_THRESHOLDS, safety_mentions)]
         }
 
-    def _assess_efficacy_data(self, result: Dict[str, Any]) -> Dict[str, Any]:
+    def _assess_efficacy_data(self, term_counts: Counter) -> Dict[str, Any]:
         """Assess efficacy information from research"""
 
-        analysis = result.get("analysis", "").lower()
-
-        efficacy_indicators = [
-            "efficacy", "effective", "improvement", "benefit", "outcome",
-            "response rate", "success rate", "cure", "remission"
-        ]
-
-        efficacy_mentions = sum(1 for indicator in efficacy_indicators if indicator in analysis)
+        efficacy_mentions = sum(1 for indicator in _EFFICACY_INDICATORS if indicator in term_counts)
 
         efficacy_findings = []
-        if "efficacy" in analysis or "effective" in analysis:
+        if "efficacy" in term_counts or "effective" in term_counts:
             efficacy_findings.append("Efficacy data available")
-        if "improvement" in analysis or "benefit" in analysis:
+        if "improvement" in term_counts or "benefit" in term_counts:
             efficacy_findings.append("Clinical benefits documented")
-        if "response rate" in analysis or "success rate" in analysis:
+        if "response rate" in term_counts or "success rate" in term_counts:
             efficacy_findings.append("Response rates reported")
 
         return {
             "efficacy_mentions": efficacy_mentions,
             "efficacy_findings": efficacy_findings,
             "efficacy_data_available": efficacy_mentions > 0,
-            "efficacy_assessment": "Strong" if efficacy_mentions > 3 else
-                                  "Moderate" if efficacy_mentions > 1 else
-                                  "Limited"
+            "efficacy_assessment": _EFFICACY_LABELS[bisect.bisect_left(_MENTION_THRESHOLDS, efficacy_mentions)]
         }
 
-    def _assess_regulatory_status(self, result: Dict[str, Any]) -> Dict[str, Any]:
+    def _assess_regulatory_status(self, term_counts: Counter) -> Dict[str, Any]:
         """Assess regulatory and approval status"""
 
-        analysis = result.get("analysis", "").lower()
-
-        regulatory_terms = [
-            "fda approved", "fda approval", "approved by", "licensed",
-            "regulatory", "clinical trial", "phase", "investigational"
-        ]
-
-        regulatory_mentions = sum(1 for term in regulatory_terms if term in analysis)
+        regulatory_mentions = sum(1 for term in _REGULATORY_TERMS if term in term_counts)
 
         status_indicators = []
-        if "fda approved" in analysis or "fda approval" in analysis:
+        if "fda approved" in term_counts or "fda approval" in term_counts:
             status_indicators.append("FDA approved")
-        if "clinical trial" in analysis:
+        if "clinical trial" in term_counts:
             status_indicators.append("In clinical trials")
-        if "investigational" in analysis:
+        if "investigational" in term_counts:
             status_indicators.append("Investigational status")
 
         return {
@@ -272,12 +247,10 @@ class DoctorAgent:
             "regulatory_info_available": regulatory_mentions > 0
         }
 
-    def _extract_medical_insights(self, result: Dict[str, Any]) -> List[str]:
+    def _extract_medical_insights(self, result: Dict[str, Any], term_counts: Counter) -> List[str]:
         """Extract medical-specific insights"""
 
         insights = []
-        analysis = result.get("analysis", "")
-
         # Clinical evidence insights
         clinical_evidence = result.get("clinical_evidence", {})
         if clinical_evidence.get("has_systematic_review"):
@@ -299,26 +272,7 @@ class DoctorAgent:
             insights.append("High proportion of medical and clinical sources")
 
         # Look for treatment guidelines
-        if any(term in analysis.lower() for term in ["guideline", "recommendation", "standard of care"]):
+        if any(term in term_counts for term in _GUIDELINE_TERMS):
             insights.append("Treatment guidelines and recommendations identified")
 
         return insights
-
-    def get_info(self) -> Dict[str, Any]:
-        """Get agent information"""
-        return {
-            "agent_id": self.agent_id,
-            "name": self.name,
-            "icon": self.icon,
-            "specialty": self.specialty,
-            "description": self.description,
-            "capabilities": self.capabilities,
-            "keywords": self.keywords,
-            "example_queries": self.example_queries,
-            "research_count": len(self.research_history),
-            "status": "🟢 Ready"
-        }
-
-    def get_research_history(self) -> List[Dict[str, Any]]:
-        """Get research history"""
-        return self.research_history[-10:]  # Last 10 research queries
\ No newline at end of file
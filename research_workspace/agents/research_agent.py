@@ -4,111 +4,112 @@ Clean, simple implementation focused on academic research
 """
 
 from typing import Dict, List, Any, Optional
-from datetime import datetime
-import sys
-import os
-
-# Add path for core components
-sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
-from core.research_engine import RealResearchEngine
-
-class ResearchAgent:
+from collections import Counter
+import re
+
+from .base import BaseAgent, format_agent_context
+from ..core.keyword_matcher import KeywordMatcher
+from ..core.domain_match import DomainSet
+
+def _any_term_re(terms) -> re.Pattern:
+    """One compiled alternation that finds any of the terms as a substring"""
+    return re.compile("|".join(map(re.escape, terms)))
+
+# Academic vocabulary, compiled once so each check is a single C-level scan
+# Domain lists are matched against hostname labels (see DomainSet)
+_ACADEMIC_DOMAINS = DomainSet([
+    ".edu", ".org", "pubmed", "scholar.google", "researchgate",
+    "arxiv", "jstor", "springer", "elsevier", "wiley", "nature",
+    "science", "cell", "lancet", "thelancet", "nejm"
+])
+
+_RESEARCH_TERMS = (
+    "study", "research", "analysis", "evidence", "data", "findings",
+    "methodology", "systematic", "meta-analysis", "peer-reviewed"
+)
+# Every research term is a single token under this pattern ("meta-analysis", "peer-reviewed");
+# a term counts every token it starts ("researchers", "data-driven") but not tokens that merely
+# contain it ("meta-analysis" is not also "analysis"), and no term is a prefix of another
+_WORD_RE = re.compile(r"[a-z][a-z-]*")
+
+# (academic ratio above, evidence indicators above, label), best band first
+_RESEARCH_QUALITY_BANDS = (
+    (0.7, 10, "High - Strong academic sources and evidence base"),
+    (0.4, 5, "Medium - Moderate academic coverage")
+)
+
+_CREDIBILITY_TIERS = (
+    ("tier1", DomainSet([".edu", "pubmed", "scholar.google", "nature", "science", "cell"])),
+    ("tier2", DomainSet([".org", "researchgate", "arxiv", "springer", "elsevier"])),
+    ("tier3", DomainSet([".gov", "who.int", "cdc.gov", "nih.gov"]))
+)
+
+_STRONG_INDICATORS = ("systematic review", "meta-analysis", "randomized controlled", "peer-reviewed", "longitudinal study")
+_MODERATE_INDICATORS = ("cohort study", "case-control", "cross-sectional", "observational")
+_WEAK_INDICATORS = ("case report", "expert opinion", "editorial", "commentary")
+_EVIDENCE_MATCHER = KeywordMatcher(_STRONG_INDICATORS + _MODERATE_INDICATORS + _WEAK_INDICATORS)
+
+# Fixed parts of the enhanced query; only the user query and context vary per call
+_ACADEMIC_FOCUS_SUFFIX = " academic research scientific study"
+_ACADEMIC_FOCUS_FOOTER = "\n\nFocus on: peer-reviewed sources, academic journals, research studies, scientific evidence"
+
+_RESEARCH_GAP_RE = _any_term_re(("gap", "limitation", "future research", "further study"))
+_METHODOLOGY_RE = _any_term_re(("methodology", "method", "approach", "design"))
+_CONSENSUS_RE = _any_term_re(("consensus", "agreement", "widely accepted"))
+_CONTROVERSY_RE = _any_term_re(("controversy", "debate", "conflicting", "disputed"))
+
+class ResearchAgent(BaseAgent):
     """
     Specialized agent for academic research and scientific literature
     """
 
-    def __init__(self):
-        self.agent_id = "research"
-        self.name = "Research Agent"
-        self.icon = "🔬"
-        self.specialty = "Academic research and scientific literature"
-        self.description = "Specializes in academic research, scientific papers, literature reviews, and theoretical analysis"
-
-        self.capabilities = [
-            "Literature reviews and systematic reviews",
-            "Scientific paper analysis and evaluation",
-            "Research methodology guidance",
-            "Academic source verification",
-            "Theoretical framework development",
-            "Evidence synthesis and meta-analysis",
-            "Peer review quality assessment",
-            "Citation and impact analysis"
-        ]
-
-        self.keywords = [
-            "research", "academic", "study", "literature", "science",
-            "paper", "journal", "theory", "methodology", "evidence",
-            "analysis", "systematic", "meta", "peer-reviewed"
-        ]
-
-        self.example_queries = [
-            "What does recent research say about climate change effects?",
-            "Systematic review of AI in healthcare applications",
-            "Literature review on renewable energy technologies",
-            "Research methodology for machine learning studies"
-        ]
-
-        # Initialize research engine
-        self.research_engine = RealResearchEngine()
-        self.research_history = []
-
-    def research(self, query: str, context: Optional[Dict] = None) -> Dict[str, Any]:
-        """
-        Perform academic research with scientific focus
-
-        Args:
-            query: Research question
-            context: Optional context from other agents
-
-        Returns:
-            Comprehensive research results
-        """
-
-        print(f"🔬 Research Agent analyzing: {query}")
-
-        # Enhance query for academic focus
-        academic_query = self._enhance_for_academic_research(query, context)
-
-        # Perform comprehensive research
-        result = self.research_engine.comprehensive_research(academic_query, "research")
-
-        # Add academic-specific post-processing
-        enhanced_result = self._add_academic_analysis(result, query)
-
-        # Store in history
-        self.research_history.append({
-            "query": query,
-            "result": enhanced_result,
-            "timestamp": datetime.now().isoformat()
-        })
-
-        return enhanced_result
-
-    def _enhance_for_academic_research(self, query: str, context: Optional[Dict] = None) -> str:
+    __slots__ = ()
+
+    agent_id = "research"
+    name = "Research Agent"
+    icon = "🔬"
+    specialty = "Academic research and scientific literature"
+    description = "Specializes in academic research, scientific papers, literature reviews, and theoretical analysis"
+
+    capabilities = [
+        "Literature reviews and systematic reviews",
+        "Scientific paper analysis and evaluation",
+        "Research methodology guidance",
+        "Academic source verification",
+        "Theoretical framework development",
+        "Evidence synthesis and meta-analysis",
+        "Peer review quality assessment",
+        "Citation and impact analysis"
+    ]
+
+    keywords = [
+        "research", "academic", "study", "literature", "science",
+        "paper", "journal", "theory", "methodology", "evidence",
+        "analysis", "systematic", "meta", "peer-reviewed"
+    ]
+
+    example_queries = [
+        "What does recent research say about climate change effects?",
+        "Systematic review of AI in healthcare applications",
+        "Literature review on renewable energy technologies",
+        "Research methodology for machine learning studies"
+    ]
+
+    def _enhance_query(self, query: str, context: Optional[Dict] = None) -> str:
         """Enhance query with academic research focus"""
 
-        enhanced_parts = []
-
-        # Add academic search terms
-        enhanced_parts.append(f"{query} academic research scientific study")
+        # The context block is only built when other agents passed context
+        context_block = format_agent_context(context) if context else ""
+        return f"{query}{_ACADEMIC_FOCUS_SUFFIX}{context_block}{_ACADEMIC_FOCUS_FOOTER}"
 
-        # Add context if available
-        if context:
-            enhanced_parts.append("\nContext from other research agents:")
-            for agent_id, insights in context.items():
-                if isinstance(insights, dict) and insights.get("key_points"):
-                    enhanced_parts.append(f"{agent_id}: {', '.join(insights['key_points'][:2])}")
-
-        # Add academic focus
-        enhanced_parts.append("\nFocus on: peer-reviewed sources, academic journals, research studies, scientific evidence")
-
-        return "\n".join(enhanced_parts)
-
-    def _add_academic_analysis(self, result: Dict[str, Any], original_query: str) -> Dict[str, Any]:
+    def _post_process(self, result: Dict[str, Any], original_query: str) -> Dict[str, Any]:
         """Add academic-specific analysis to research results"""
 
+        # Lowercase the analysis once for every term check below
+        analysis_lower = result.get("analysis", "").lower()
+
         # Enhanced academic metrics
-        academic_metrics = self._calculate_academic_metrics(result)
+        academic_metrics = self._calculate_academic_metrics(result, analysis_lower)
 
         # Add academic-specific fields
         result.update({
@@ -116,43 +117,31 @@ class ResearchAgent:
             "academic_metrics": academic_metrics,
             "research_quality": self._assess_research_quality(result),
             "source_credibility": self._assess_source_credibility(result),
-            "evidence_strength": self._assess_evidence_strength(result),
-            "academic_insights": self._extract_academic_insights(result)
+            "evidence_strength": self._assess_evidence_strength(analysis_lower),
+            "academic_insights": self._extract_academic_insights(result, analysis_lower)
         })
 
         return result
 
-    def _calculate_academic_metrics(self, result: Dict[str, Any]) -> Dict[str, Any]:
+    def _calculate_academic_metrics(self, result: Dict[str, Any], analysis_lower: str) -> Dict[str, Any]:
         """Calculate academic-specific metrics"""
 
         sources = result.get("sources", [])
-        analysis = result.get("analysis", "")
 
         # Count academic sources
-        academic_domains = [
-            ".edu", ".org", "pubmed", "scholar.google", "researchgate",
-            "arxiv", "jstor", "springer", "elsevier", "wiley", "nature",
-            "science", "cell", "lancet", "nejm"
-        ]
+        academic_source_count = sum(1 for source in sources if _ACADEMIC_DOMAINS.matches(source))
 
-        academic_source_count = 0
-        for source in sources:
-            if any(domain in source.lower() for domain in academic_domains):
-                academic_source_count += 1
-
-        # Count research-specific terms
-        research_terms = [
-            "study", "research", "analysis", "evidence", "data", "findings",
-            "methodology", "systematic", "meta-analysis", "peer-reviewed"
-        ]
-
-        research_term_count = sum(analysis.lower().count(term) for term in research_terms)
+        # Count research-specific terms with one tokenization and one prefix test per distinct word
+        words = _WORD_RE.findall(analysis_lower)
+        research_term_count = sum(
+            count for word, count in Counter(words).items() if word.startswith(_RESEARCH_TERMS)
+        )
 
         return {
             "total_sources": len(sources),
             "academic_sources": academic_source_count,
             "academic_source_ratio": academic_source_count / len(sources) if sources else 0,
-            "research_term_density": research_term_count / len(analysis.split()) if analysis else 0,
+            "research_term_density": research_term_count / len(words) if words else 0,
             "evidence_indicators": research_term_count
         }
 
@@ -163,30 +152,21 @@ class ResearchAgent:
         academic_ratio = metrics.get("academic_source_ratio", 0)
         evidence_indicators = metrics.get("evidence_indicators", 0)
 
-        if academic_ratio > 0.7 and evidence_indicators > 10:
-            return "High - Strong academic sources and evidence base"
-        elif academic_ratio > 0.4 and evidence_indicators > 5:
-            return "Medium - Moderate academic coverage"
-        else:
-            return "Low - Limited academic sources available"
+        for min_ratio, min_indicators, quality in _RESEARCH_QUALITY_BANDS:
+            if academic_ratio > min_ratio and evidence_indicators > min_indicators:
+                return quality
+        return "Low - Limited academic sources available"
 
     def _assess_source_credibility(self, result: Dict[str, Any]) -> Dict[str, Any]:
         """Assess credibility of sources"""
 
         sources = result.get("sources", [])
 
-        credibility_tiers = {
-            "tier1": [".edu", "pubmed", "scholar.google", "nature", "science", "cell"],
-            "tier2": [".org", "researchgate", "arxiv", "springer", "elsevier"],
-            "tier3": [".gov", "who.int", "cdc.gov", "nih.gov"]
-        }
-
-        tier_counts = {tier: 0 for tier in credibility_tiers}
+        tier_counts = {tier: 0 for tier, _ in _CREDIBILITY_TIERS}
 
         for source in sources:
-            source_lower = source.lower()
-            for tier, domains in credibility_tiers.items():
-                if any(domain in source_lower for domain in domains):
+            for tier, domains in _CREDIBILITY_TIERS:
+                if domains.matches(source):
                     tier_counts[tier] += 1
                     break
 
@@ -211,18 +191,14 @@ class ResearchAgent:
 
         return min(score, 1.0)
 
-    def _assess_evidence_strength(self, result: Dict[str, Any]) -> str:
+    def _assess_evidence_strength(self, analysis_lower: str) -> str:
         """Assess strength of evidence based on content analysis"""
 
-        analysis = result.get("analysis", "").lower()
+        found = _EVIDENCE_MATCHER.found(analysis_lower)
 
-        strong_indicators = ["systematic review", "meta-analysis", "randomized controlled", "peer-reviewed", "longitudinal study"]
-        moderate_indicators = ["cohort study", "case-control", "cross-sectional", "observational"]
-        weak_indicators = ["case report", "expert opinion", "editorial", "commentary"]
-
-        strong_count = sum(1 for indicator in strong_indicators if indicator in analysis)
-        moderate_count = sum(1 for indicator in moderate_indicators if indicator in analysis)
-        weak_count = sum(1 for indicator in weak_indicators if indicator in analysis)
+        strong_count = sum(1 for indicator in _STRONG_INDICATORS if indicator in found)
+        moderate_count = sum(1 for indicator in _MODERATE_INDICATORS if indicator in found)
+        weak_count = sum(1 for indicator in _WEAK_INDICATORS if indicator in found)
 
         if strong_count >= 2:
             return "Strong - Multiple high-quality study types identified"
@@ -231,18 +207,17 @@ class ResearchAgent:
         else:
             return "Limited - Primarily observational or opinion-based sources"
 
-    def _extract_academic_insights(self, result: Dict[str, Any]) -> List[str]:
+    def _extract_academic_insights(self, result: Dict[str, Any], analysis_lower: str) -> List[str]:
         """Extract academic-specific insights"""
 
         insights = []
-        analysis = result.get("analysis", "")
 
         # Look for research gaps
-        if any(term in analysis.lower() for term in ["gap", "limitation", "future research", "further study"]):
+        if _RESEARCH_GAP_RE.search(analysis_lower):
             insights.append("Research gaps and future directions identified")
 
         # Look for methodology discussions
-        if any(term in analysis.lower() for term in ["methodology", "method", "approach", "design"]):
+        if _METHODOLOGY_RE.search(analysis_lower):
             insights.append("Methodological considerations discussed")
 
         # Look for evidence quality
@@ -251,28 +226,9 @@ class ResearchAgent:
             insights.append("High proportion of academic sources found")
 
         # Look for consensus or controversy
-        if any(term in analysis.lower() for term in ["consensus", "agreement", "widely accepted"]):
+        if _CONSENSUS_RE.search(analysis_lower):
             insights.append("Scientific consensus indicators found")
-        elif any(term in analysis.lower() for term in ["controversy", "debate", "conflicting", "disputed"]):
+        elif _CONTROVERSY_RE.search(analysis_lower):
             insights.append("Scientific debate or controversy noted")
 
         return insights
-
-    def get_info(self) -> Dict[str, Any]:
-        """Get agent information"""
-        return {
-            "agent_id": self.agent_id,
-            "name": self.name,
-            "icon": self.icon,
-            "specialty": self.specialty,
-            "description": self.description,
-            "capabilities": self.capabilities,
-            "keywords": self.keywords,
-            "example_queries": self.example_queries,
-            "research_count": len(self.research_history),
-            "status": "🟢 Ready"
-        }
-
-    def get_research_history(self) -> List[Dict[str, Any]]:
-        """Get research history"""
-        return self.research_history[-10:]  # Last 10 research queries
\ No newline at end of file
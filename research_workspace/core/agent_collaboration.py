@@ -3,11 +3,75 @@ Agent Collaboration System - Real inter-agent communication
 Enables agents to share findings and build on each other's research
 """
 
-import json
+import asyncio
+import re
+import sys
+import threading
 import time
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Callable
+from collections import Counter, OrderedDict, deque
+from dataclasses import dataclass, field
 from datetime import datetime
-from .research_engine import RealResearchEngine
+from .research_engine import get_default_engine
+from .result_cache import ResultCache, normalize_query
+
+# Completed sessions hold every agent's full result, so only the most recent ones are kept
+MAX_SESSIONS = 256
+MAX_COMMUNICATIONS = 5000
+
+# Common words ignored when looking for shared themes
+_STOP_WORDS = frozenset({
+    "the", "and", "or", "but", "in", "on", "at", "to", "for", "of", "with", "by", "is", "are", "was",
+    "were", "be", "been", "have", "has", "had", "do", "does", "did", "will", "would", "could", "should",
+    "may", "might", "can", "must", "shall", "this", "that", "these", "those", "a", "an"
+})
+
+_SPECIALIST_KEYWORDS = {
+    "doctor": ("clinical", "medical", "treatment", "symptoms", "diagnosis", "therapy"),
+    "financial": ("investment", "financial", "return", "risk", "valuation", "profit"),
+    "market": ("market", "competitive", "industry", "trends", "share", "growth"),
+    "research": ("study", "research", "evidence", "data", "findings", "analysis"),
+    "developer": ("technical", "architecture", "implementation", "scalability", "performance"),
+    "writer": ("content", "communication", "messaging", "audience", "strategy"),
+    "analyst": ("metrics", "statistics", "patterns", "insights", "correlation")
+}
+
+# One case-insensitive alternation per agent, so each sentence is scanned once without lowercasing
+_SPECIALIST_KEYWORD_RES = {
+    agent_id: re.compile("|".join(map(re.escape, keywords)), re.IGNORECASE)
+    for agent_id, keywords in _SPECIALIST_KEYWORDS.items()
+}
+
+_REPORT_SEPARATOR = "-" * 50
+
+# Insight pairs with a Jaccard similarity above this are reported as related
+_CROSS_REFERENCE_THRESHOLD = 0.3
+
+# Lines mentioning any of these (as substrings, so "recommendation" counts) become recommendations
+_RECOMMENDATION_RE = re.compile("recommend|suggest|should|consider|advise", re.IGNORECASE)
+
+# Theme candidates: runs of five or more letters, found in one C-level scan
+_THEME_WORD_RE = re.compile(r"[a-z]{5,}")
+
+# Slotted dataclasses need Python 3.10+; older runtimes fall back to a regular one
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(**_DATACLASS_SLOTS)
+class CollaborationSession:
+    """State of one collaboration session"""
+
+    session_id: str
+    agents: List[str]
+    query: str
+    start_time: str = field(default_factory=lambda: datetime.now().isoformat())
+    perf_start: float = field(default_factory=time.perf_counter)
+    status: str = "active"
+    agent_results: Dict[str, Any] = field(default_factory=dict)
+    shared_context: Dict[str, Any] = field(default_factory=dict)
+    communications: List[Dict[str, Any]] = field(default_factory=list)
+    final_synthesis: Optional[Dict[str, Any]] = None
+    end_time: Optional[str] = None
+    perf_end: Optional[float] = None
 
 class AgentCollaborationManager:
     """
@@ -15,11 +79,16 @@ class AgentCollaborationManager:
     """
 
     def __init__(self):
-        self.research_engine = RealResearchEngine()
-        self.collaboration_sessions = {}
-        self.agent_communications = []
-
-    def start_collaboration_session(self, session_id: str, agents: List[str], query: str) -> Dict[str, Any]:
+        # Same engine (HTTP pool, AI client, health flag) the agents use
+        self.research_engine = get_default_engine()
+        self.collaboration_sessions = OrderedDict()  # Oldest session evicted first
+        self.agent_communications = deque(maxlen=MAX_COMMUNICATIONS)
+        # Per-agent engine results reused across sessions for an hour
+        self.result_cache = ResultCache(max_entries=256, ttl_seconds=3600)
+        # One manager is shared by every research job, so session/log writes come from many threads
+        self._lock = threading.Lock()
+
+    def start_collaboration_session(self, session_id: str, agents: List[str], query: str) -> CollaborationSession:
         """
         Start a new collaboration session with multiple agents
 
@@ -29,101 +98,83 @@ class AgentCollaborationManager:
             query: Research query
 
         Returns:
-            Session metadata
+            Session state
         """
 
-        session_data = {
-            "session_id": session_id,
-            "agents": agents,
-            "query": query,
-            "start_time": datetime.now().isoformat(),
-            "status": "active",
-            "agent_results": {},
-            "shared_context": {},
-            "communications": [],
-            "final_synthesis": None
-        }
+        session_data = CollaborationSession(session_id, agents, query)
 
-        self.collaboration_sessions[session_id] = session_data
+        with self._lock:
+            self.collaboration_sessions[session_id] = session_data
+            while len(self.collaboration_sessions) > MAX_SESSIONS:
+                self.collaboration_sessions.popitem(last=False)
 
-        print(f"🤝 Started collaboration session: {session_id}")
-        print(f"   Agents: {', '.join(agents)}")
-        print(f"   Query: {query}")
+        print(f"🤝 Started collaboration session: {session_id}\n"
+              f"   Agents: {', '.join(agents)}\n"
+              f"   Query: {query}")
 
         return session_data
 
-    def execute_collaborative_research(self, session_id: str, mode: str = "parallel") -> Dict[str, Any]:
+    def execute_collaborative_research(self, session_id: str, mode: str = "parallel",
+                                       on_agent_complete: Optional[Callable[[str, int, int], None]] = None,
+                                       on_synthesis_text: Optional[Callable[[str], None]] = None) -> Dict[str, Any]:
         """
         Execute collaborative research with real agent communication
 
         Args:
             session_id: Session identifier
             mode: "parallel" or "sequential"
+            on_agent_complete: Optional callback(agent_id, completed, total) fired as each agent finishes
+            on_synthesis_text: Optional callback receiving the final synthesis text in batches as it streams
 
         Returns:
             Complete collaboration results
         """
 
-        if session_id not in self.collaboration_sessions:
+        session = self.collaboration_sessions.get(session_id)
+        if session is None:
             raise ValueError(f"Session {session_id} not found")
 
-        session = self.collaboration_sessions[session_id]
-        agents = session["agents"]
-        query = session["query"]
-
         print(f"🚀 Executing {mode} collaborative research...")
 
         if mode == "parallel":
-            return self._execute_parallel_research(session)
+            return self._execute_parallel_research(session, on_agent_complete, on_synthesis_text)
         else:
-            return self._execute_sequential_research(session)
+            return self._execute_sequential_research(session, on_agent_complete, on_synthesis_text)
 
-    def _execute_parallel_research(self, session: Dict[str, Any]) -> Dict[str, Any]:
+    def _execute_parallel_research(self, session: CollaborationSession,
+                                   on_agent_complete: Optional[Callable[[str, int, int], None]] = None,
+                                   on_synthesis_text: Optional[Callable[[str], None]] = None) -> Dict[str, Any]:
         """Execute parallel research where agents work simultaneously"""
 
-        agents = session["agents"]
-        query = session["query"]
-        session_id = session["session_id"]
+        agents = session.agents
+        query = session.query
+        session_id = session.session_id
 
         print(f"⚡ Parallel execution with {len(agents)} agents")
 
         # Step 1: All agents research simultaneously
-        agent_results = {}
-
-        for agent_id in agents:
-            print(f"🤖 {agent_id.title()} agent starting research...")
-
-            # Each agent does their specialized research
-            agent_result = self.research_engine.comprehensive_research(query, agent_id)
-
-            agent_results[agent_id] = agent_result
+        agent_results = asyncio.run(self._gather_agent_research(query, agents, on_agent_complete))
 
-            # Store in session
-            session["agent_results"][agent_id] = agent_result
-
-            # Print agent contribution to terminal
-            print(f"✅ {agent_id.title()} agent completed research")
-            print(f"   📊 Sources found: {len(agent_result.get('sources', []))}")
-            if agent_result.get('analysis'):
-                print(f"   🧠 Analysis: {agent_result['analysis'][:150]}...")
-            print(f"   ⏱️  Processing time: {agent_result.get('processing_time', 0):.1f}s")
-            print("-" * 50)
+        # Store in session
+        with self._lock:
+            session.agent_results.update(agent_results)
 
         # Step 2: Agents share insights (post-processing collaboration)
         print(f"🔄 Agents sharing insights and collaborating...")
 
         shared_insights = self._extract_shared_insights(agent_results)
-        session["shared_context"] = shared_insights
+        session.shared_context = shared_insights
 
         # Step 3: Generate collaborative synthesis
-        synthesis = self._synthesize_collaborative_results(agent_results, query, shared_insights)
-        session["final_synthesis"] = synthesis
+        synthesis = self._synthesize_collaborative_results(agent_results, query, shared_insights, on_synthesis_text)
+        session.final_synthesis = synthesis
 
         # Step 4: Log collaboration communications
         self._log_collaboration_communications(session_id, agent_results, shared_insights)
 
-        session["status"] = "completed"
-        session["end_time"] = datetime.now().isoformat()
+        session.status = "completed"
+        session.end_time = datetime.now().isoformat()
+        session.perf_end = time.perf_counter()
 
         return {
             "session_id": session_id,
@@ -132,16 +183,69 @@ class AgentCollaborationManager:
             "individual_results": agent_results,
             "shared_insights": shared_insights,
             "synthesized_result": synthesis,
-            "collaboration_log": session["communications"],
+            "collaboration_log": self._format_communications(session.communications),
             "processing_time": self._calculate_session_time(session)
         }
 
-    def _execute_sequential_research(self, session: Dict[str, Any]) -> Dict[str, Any]:
+    async def _gather_agent_research(self, query: str, agents: List[str],
+                                     on_agent_complete: Optional[Callable[[str, int, int], None]] = None) -> Dict[str, Dict[str, Any]]:
+        """Run every agent's research concurrently; the blocking engine calls are offloaded to worker threads"""
+
+        async def run_agent(agent_id: str):
+            print(f"🤖 {agent_id.title()} agent starting research...")
+
+            # Each agent does their specialized research; one agent failing must not sink the others
+            try:
+                agent_result = await asyncio.to_thread(self._agent_research, query, agent_id)
+            except Exception as e:
+                print(f"❌ {agent_id.title()} agent failed: {e}")
+                agent_result = {
+                    "query": query,
+                    "agent_type": agent_id,
+                    "success": False,
+                    "error": str(e),
+                    "timestamp": datetime.now().isoformat()
+                }
+            return agent_id, agent_result
+
+        agent_results = {}
+
+        for next_completed in asyncio.as_completed([run_agent(agent_id) for agent_id in agents]):
+            agent_id, agent_result = await next_completed
+            agent_results[agent_id] = agent_result
+
+            # Print agent contribution to terminal as one write, so concurrent agents' reports don't interleave
+            report_lines = [
+                f"✅ {agent_id.title()} agent completed research",
+                f"   📊 Sources found: {len(agent_result.get('sources', []))}"
+            ]
+            if agent_result.get('analysis'):
+                report_lines.append(f"   🧠 Analysis: {agent_result['analysis'][:150]}...")
+            report_lines.append(f"   ⏱️  Processing time: {agent_result.get('processing_time', 0):.1f}s")
+            report_lines.append(_REPORT_SEPARATOR)
+            print("\n".join(report_lines))
+
+            if on_agent_complete:
+                on_agent_complete(agent_id, len(agent_results), len(agents))
+
+        # Keep the selection order regardless of which agent finished first
+        return {agent_id: agent_results[agent_id] for agent_id in agents}
+
+    def _agent_research(self, query: str, agent_id: str) -> Dict[str, Any]:
+        """One agent's engine research, served from the cross-session cache when fresh"""
+        return self.result_cache.get_or_compute(
+            (agent_id, normalize_query(query)),
+            lambda: self.research_engine.comprehensive_research(query, agent_id)
+        )
+
+    def _execute_sequential_research(self, session: CollaborationSession,
+                                     on_agent_complete: Optional[Callable[[str, int, int], None]] = None,
+                                     on_synthesis_text: Optional[Callable[[str], None]] = None) -> Dict[str, Any]:
         """Execute sequential research where agents build on each other's findings"""
 
-        agents = session["agents"]
-        query = session["query"]
-        session_id = session["session_id"]
+        agents = session.agents
+        query = session.query
+        session_id = session.session_id
 
         print(f"🔄 Sequential execution with {len(agents)} agents")
 
@@ -155,14 +259,15 @@ class AgentCollaborationManager:
             enhanced_query = self._create_enhanced_query(query, cumulative_context, agent_id)
 
             # Agent performs research with context
-            agent_result = self.research_engine.comprehensive_research(enhanced_query, agent_id)
+            agent_result = self._agent_research(enhanced_query, agent_id)
 
             # Add context information
             agent_result["context_used"] = len(cumulative_context) > 0
             agent_result["enhanced_query"] = enhanced_query
 
             agent_results[agent_id] = agent_result
-            session["agent_results"][agent_id] = agent_result
+            with self._lock:
+                session.agent_results[agent_id] = agent_result
 
             # Extract insights for next agents
             agent_insights = self._extract_agent_insights(agent_result, agent_id)
@@ -173,15 +278,19 @@ class AgentCollaborationManager:
 
             print(f"✅ {agent_id.title()} agent completed, sharing insights with remaining agents")
 
+            if on_agent_complete:
+                on_agent_complete(agent_id, i + 1, len(agents))
+
         # Final synthesis with all accumulated context
         print(f"🔄 Creating final collaborative synthesis...")
 
-        synthesis = self._synthesize_collaborative_results(agent_results, query, cumulative_context)
-        session["final_synthesis"] = synthesis
-        session["shared_context"] = cumulative_context
+        synthesis = self._synthesize_collaborative_results(agent_results, query, cumulative_context, on_synthesis_text)
+        session.final_synthesis = synthesis
+        session.shared_context = cumulative_context
 
-        session["status"] = "completed"
-        session["end_time"] = datetime.now().isoformat()
+        session.status = "completed"
+        session.end_time = datetime.now().isoformat()
+        session.perf_end = time.perf_counter()
 
         return {
             "session_id": session_id,
@@ -190,7 +299,7 @@ class AgentCollaborationManager:
             "individual_results": agent_results,
             "shared_context": cumulative_context,
             "synthesized_result": synthesis,
-            "collaboration_log": session["communications"],
+            "collaboration_log": self._format_communications(session.communications),
             "processing_time": self._calculate_session_time(session)
         }
 
@@ -205,8 +314,7 @@ class AgentCollaborationManager:
 
         for agent_id, insights in context.items():
             context_parts.append(f"\n{agent_id.title()} Agent Insights:")
-            for insight in insights.get("key_points", []):
-                context_parts.append(f"• {insight}")
+            context_parts.extend([f"• {insight}" for insight in insights.get("key_points", [])])
 
         context_parts.append(f"\nAs the {current_agent} agent, provide your specialized analysis building on these findings.")
 
@@ -229,94 +337,102 @@ class AgentCollaborationManager:
 
         analysis = agent_result.get("analysis", "")
 
-        specialist_keywords = {
-            "doctor": ["clinical", "medical", "treatment", "symptoms", "diagnosis", "therapy"],
-            "financial": ["investment", "financial", "return", "risk", "valuation", "profit"],
-            "market": ["market", "competitive", "industry", "trends", "share", "growth"],
-            "research": ["study", "research", "evidence", "data", "findings", "analysis"],
-            "developer": ["technical", "architecture", "implementation", "scalability", "performance"],
-            "writer": ["content", "communication", "messaging", "audience", "strategy"],
-            "analyst": ["metrics", "statistics", "patterns", "insights", "correlation"]
-        }
+        keyword_re = _SPECIALIST_KEYWORD_RES.get(agent_id)
+        if keyword_re is None:
+            return []
 
-        keywords = specialist_keywords.get(agent_id, [])
         findings = []
+        sentence_end = -1
+
+        # Extract sentences containing specialist keywords: one scan of the analysis, and only
+        # sentences with a hit are sliced out
+        for match in keyword_re.finditer(analysis):
+            if match.start() < sentence_end:
+                continue  # Sentence already considered
 
-        # Extract sentences containing specialist keywords
-        sentences = analysis.split('.')
-        for sentence in sentences:
-            sentence = sentence.strip()
-            if any(keyword in sentence.lower() for keyword in keywords) and len(sentence) > 20:
+            sentence_start = analysis.rfind('.', 0, match.start()) + 1
+            sentence_end = analysis.find('.', match.end())
+            if sentence_end == -1:
+                sentence_end = len(analysis)
+
+            sentence = analysis[sentence_start:sentence_end].strip()
+            if len(sentence) > 20:
                 findings.append(sentence)
+                if len(findings) == 3:
+                    break
 
-        return findings[:3]  # Top 3 specialist findings
+        return findings  # Top 3 specialist findings
 
     def _extract_shared_insights(self, agent_results: Dict[str, Any]) -> Dict[str, Any]:
         """Extract insights that can be shared between agents"""
 
         all_insights = []
-        all_sources = []
+        unique_sources = {}  # Insertion-ordered set of every agent's sources
         confidence_scores = []
+        theme_text_chunks = []
 
         for agent_id, result in agent_results.items():
             all_insights.extend(result.get("key_insights", []))
-            all_sources.extend(result.get("sources", []))
+            unique_sources.update(dict.fromkeys(result.get("sources", [])))
             confidence_scores.append(result.get("confidence", 0.7))
+            theme_text_chunks.append(result.get("analysis", ""))
+            theme_text_chunks.append(result.get("executive_summary", ""))
 
         # Find common themes and cross-references
-        common_themes = self._identify_common_themes(agent_results)
+        common_themes = self._identify_common_themes(" ".join(theme_text_chunks))
         cross_references = self._find_cross_references(agent_results)
 
         return {
             "common_themes": common_themes,
             "cross_references": cross_references,
             "all_insights": all_insights,
-            "unique_sources": list(set(all_sources)),
+            "unique_sources": list(unique_sources),
             "average_confidence": sum(confidence_scores) / len(confidence_scores) if confidence_scores else 0.7,
             "agent_count": len(agent_results)
         }
 
-    def _identify_common_themes(self, agent_results: Dict[str, Any]) -> List[str]:
-        """Identify common themes across agent analyses"""
-
-        # Simple keyword-based theme identification
-        all_text = ""
-        for result in agent_results.values():
-            all_text += result.get("analysis", "") + " " + result.get("executive_summary", "")
-
-        common_words = {}
-        words = all_text.lower().split()
+    def _identify_common_themes(self, all_text: str) -> List[str]:
+        """Identify common themes across agent analyses (their analyses and summaries, joined)"""
 
-        # Count significant words (filter out common words)
-        stop_words = {"the", "and", "or", "but", "in", "on", "at", "to", "for", "of", "with", "by", "is", "are", "was", "were", "be", "been", "have", "has", "had", "do", "does", "did", "will", "would", "could", "should", "may", "might", "can", "must", "shall", "this", "that", "these", "those", "a", "an"}
-
-        for word in words:
-            word = word.strip('.,!?";()[]{}')
-            if len(word) > 4 and word not in stop_words:
-                common_words[word] = common_words.get(word, 0) + 1
+        # Simple keyword-based theme identification: count significant words (filter out common words)
+        common_words = Counter(
+            word for word in _THEME_WORD_RE.findall(all_text.lower()) if word not in _STOP_WORDS
+        )
 
         # Get most common themes
-        sorted_themes = sorted(common_words.items(), key=lambda x: x[1], reverse=True)
-        return [theme[0] for theme in sorted_themes[:5]]
+        return [theme for theme, _ in common_words.most_common(5)]
 
     def _find_cross_references(self, agent_results: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Find cross-references between agent findings"""
 
         cross_refs = []
 
+        # Tokenize every insight once rather than once per compared pair
+        tokenized_insights = {
+            agent_id: [(insight, self._tokenize(insight)) for insight in result.get("key_insights", [])]
+            for agent_id, result in agent_results.items()
+        }
+
         agents = list(agent_results.keys())
 
         for i, agent1 in enumerate(agents):
             for j, agent2 in enumerate(agents[i+1:], i+1):
                 # Compare insights between agents
-                agent1_insights = agent_results[agent1].get("key_insights", [])
-                agent2_insights = agent_results[agent2].get("key_insights", [])
+                agent1_insights = tokenized_insights[agent1]
+                agent2_insights = tokenized_insights[agent2]
 
                 # Simple similarity check
-                for insight1 in agent1_insights:
-                    for insight2 in agent2_insights:
-                        similarity = self._calculate_text_similarity(insight1, insight2)
-                        if similarity > 0.3:  # Threshold for related insights
+                for insight1, words1 in agent1_insights:
+                    size1 = len(words1)
+                    for insight2, words2 in agent2_insights:
+                        # Jaccard similarity never exceeds smaller/larger set size, so pairs too
+                        # different in size can't pass the threshold and skip the set intersection
+                        size2 = len(words2)
+                        if not size1 or not size2 or min(size1, size2) / max(size1, size2) <= _CROSS_REFERENCE_THRESHOLD:
+                            continue
+
+                        similarity = self._token_similarity(words1, words2)
+                        if similarity > _CROSS_REFERENCE_THRESHOLD:
                             cross_refs.append({
                                 "agent1": agent1,
                                 "agent2": agent2,
@@ -324,36 +440,54 @@ class AgentCollaborationManager:
                                 "insight2": insight2,
                                 "similarity": similarity
                             })
+                            # Only the first 5 are reported, so stop comparing once they are found
+                            if len(cross_refs) == 5:
+                                return cross_refs
 
-        return cross_refs[:5]  # Top 5 cross-references
+        return cross_refs
 
     def _calculate_text_similarity(self, text1: str, text2: str) -> float:
         """Simple text similarity calculation"""
-        words1 = set(text1.lower().split())
-        words2 = set(text2.lower().split())
+        return self._token_similarity(self._tokenize(text1), self._tokenize(text2))
+
+    @staticmethod
+    def _tokenize(text: str) -> frozenset:
+        return frozenset(text.lower().split())
 
-        intersection = words1.intersection(words2)
-        union = words1.union(words2)
+    @staticmethod
+    def _token_similarity(words1: frozenset, words2: frozenset) -> float:
+        """Jaccard similarity of two pre-tokenized word sets"""
+        intersection = len(words1 & words2)
+        union = len(words1) + len(words2) - intersection
 
-        return len(intersection) / len(union) if union else 0
+        return intersection / union if union else 0
 
-    def _synthesize_collaborative_results(self, agent_results: Dict[str, Any], original_query: str, shared_context: Dict[str, Any]) -> Dict[str, Any]:
+    def _synthesize_collaborative_results(self, agent_results: Dict[str, Any], original_query: str, shared_context: Dict[str, Any],
+                                          on_synthesis_text: Optional[Callable[[str], None]] = None) -> Dict[str, Any]:
         """Create final synthesis of all agent results"""
 
+        # Gemini failed moments ago; skip building a prompt that would only be discarded
+        if not self.research_engine.is_ai_available():
+            print("⚠️ AI synthesis unavailable, creating manual synthesis...")
+            return self._create_manual_synthesis(agent_results, original_query, shared_context)
+
         print("🔄 Synthesizing collaborative results with AI...")
 
         # Compile all findings for synthesis
-        synthesis_content = f"Original Query: {original_query}\n\n"
-
-        synthesis_content += "Agent Findings Summary:\n"
+        content_lines = [f"Original Query: {original_query}", "", "Agent Findings Summary:"]
         for agent_id, result in agent_results.items():
-            synthesis_content += f"\n{agent_id.title()} Agent:\n"
-            synthesis_content += f"Summary: {result.get('executive_summary', '')}\n"
-            synthesis_content += f"Key Insights: {', '.join(result.get('key_insights', []))}\n"
-            synthesis_content += f"Confidence: {result.get('confidence', 0.7):.1%}\n"
+            content_lines.extend((
+                "",
+                f"{agent_id.title()} Agent:",
+                f"Summary: {result.get('executive_summary', '')}",
+                f"Key Insights: {', '.join(result.get('key_insights', []))}",
+                f"Confidence: {result.get('confidence', 0.7):.1%}"
+            ))
 
         if shared_context.get("common_themes"):
-            synthesis_content += f"\nCommon Themes: {', '.join(shared_context['common_themes'])}\n"
+            content_lines.extend(("", f"Common Themes: {', '.join(shared_context['common_themes'])}"))
+
+        synthesis_content = "\n".join(content_lines) + "\n"
 
         # Use AI to create professional synthesis
         synthesis_prompt = f"""
@@ -377,7 +511,7 @@ class AgentCollaborationManager:
 
         # Use Gemini for synthesis with fallback
         print("🤖 Starting AI synthesis...")
-        ai_synthesis = self.research_engine.analyze_with_gemini(synthesis_prompt, "general")
+        ai_synthesis = self.research_engine.analyze_with_gemini(synthesis_prompt, "general", on_text=on_synthesis_text)
 
         # Check if synthesis was successful
         if ai_synthesis.get("error") or not ai_synthesis.get("analysis"):
@@ -432,15 +566,22 @@ class AgentCollaborationManager:
             executive_summary += f"comprehensive analysis of '{original_query}' has been completed."
 
         # Create detailed synthesis
-        detailed_synthesis = f"# Comprehensive Research Analysis\n\n"
-        detailed_synthesis += f"**Query:** {original_query}\n\n"
-        detailed_synthesis += f"**Research Summary:** This analysis combines insights from {len(agent_results)} specialized AI agents who analyzed {all_sources} web sources.\n\n"
+        synthesis_lines = [
+            "# Comprehensive Research Analysis",
+            "",
+            f"**Query:** {original_query}",
+            "",
+            f"**Research Summary:** This analysis combines insights from {len(agent_results)} specialized AI agents who analyzed {all_sources} web sources.",
+            ""
+        ]
 
         for agent_id, result in agent_results.items():
             agent_name = agent_id.title()
             analysis = result.get('analysis', '')
             if analysis:
-                detailed_synthesis += f"## {agent_name} Agent Findings\n{analysis[:500]}...\n\n"
+                synthesis_lines.extend((f"## {agent_name} Agent Findings", f"{analysis[:500]}...", ""))
+
+        detailed_synthesis = "\n".join(synthesis_lines) + "\n"
 
         return {
             "executive_summary": executive_summary,
@@ -478,22 +619,32 @@ class AgentCollaborationManager:
     def _extract_recommendations(self, synthesis_text: str) -> List[str]:
         """Extract recommendations from synthesis text"""
 
-        lines = synthesis_text.split('\n')
         recommendations = []
+        line_end = -1
+
+        # One scan of the whole text; each hit is expanded to the line containing it
+        for match in _RECOMMENDATION_RE.finditer(synthesis_text):
+            if match.start() < line_end:
+                continue  # Line already considered
 
-        for line in lines:
-            line = line.strip()
-            if any(keyword in line.lower() for keyword in ['recommend', 'suggest', 'should', 'consider', 'advise']):
-                if len(line) > 20 and not line.startswith('#'):
-                    recommendations.append(line)
+            line_start = synthesis_text.rfind('\n', 0, match.start()) + 1
+            line_end = synthesis_text.find('\n', match.end())
+            if line_end == -1:
+                line_end = len(synthesis_text)
 
-        return recommendations[:5]
+            line = synthesis_text[line_start:line_end].strip()
+            if len(line) > 20 and not line.startswith('#'):
+                recommendations.append(line)
+                if len(recommendations) == 5:
+                    break
+
+        return recommendations
 
     def _log_agent_communication(self, session_id: str, agent_id: str, insights: Dict[str, Any], cumulative_context: Dict[str, Any]) -> None:
         """Log agent communication for transparency"""
 
         communication = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp_ns": time.time_ns(),
             "session_id": session_id,
             "agent_id": agent_id,
             "action": "shared_insights",
@@ -502,14 +653,17 @@ class AgentCollaborationManager:
             "communication_summary": f"{agent_id} shared {len(insights.get('key_points', []))} insights"
         }
 
-        self.agent_communications.append(communication)
-        self.collaboration_sessions[session_id]["communications"].append(communication)
+        with self._lock:
+            self.agent_communications.append(communication)
+            session = self.collaboration_sessions.get(session_id)
+            if session is not None:
+                session.communications.append(communication)
 
     def _log_collaboration_communications(self, session_id: str, agent_results: Dict[str, Any], shared_insights: Dict[str, Any]) -> None:
         """Log final collaboration communications"""
 
         communication = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp_ns": time.time_ns(),
             "session_id": session_id,
             "action": "collaboration_synthesis",
             "agents_involved": list(agent_results.keys()),
@@ -518,23 +672,36 @@ class AgentCollaborationManager:
             "communication_summary": f"Final synthesis created from {len(agent_results)} agent analyses"
         }
 
-        self.agent_communications.append(communication)
-        self.collaboration_sessions[session_id]["communications"].append(communication)
-
-    def _calculate_session_time(self, session: Dict[str, Any]) -> float:
+        with self._lock:
+            self.agent_communications.append(communication)
+            session = self.collaboration_sessions.get(session_id)
+            if session is not None:
+                session.communications.append(communication)
+
+    @staticmethod
+    def _format_communications(communications: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Log entries with their time.time_ns() stamps rendered as ISO strings, only when read"""
+        formatted = []
+        for communication in communications:
+            entry = {"timestamp": datetime.fromtimestamp(communication["timestamp_ns"] / 1_000_000_000).isoformat()}
+            entry.update((key, value) for key, value in communication.items() if key != "timestamp_ns")
+            formatted.append(entry)
+        return formatted
+
+    def _calculate_session_time(self, session: CollaborationSession) -> float:
         """Calculate total session processing time"""
 
-        if "start_time" in session and "end_time" in session:
-            start = datetime.fromisoformat(session["start_time"])
-            end = datetime.fromisoformat(session["end_time"])
-            return (end - start).total_seconds()
+        # Monotonic counters; the ISO start/end times are kept for display only
+        if session.perf_end is not None:
+            return session.perf_end - session.perf_start
 
         return 0.0
 
     def get_collaboration_log(self, session_id: str) -> List[Dict[str, Any]]:
         """Get collaboration communication log for a session"""
 
-        if session_id in self.collaboration_sessions:
-            return self.collaboration_sessions[session_id].get("communications", [])
+        session = self.collaboration_sessions.get(session_id)
+        if session is not None:
+            return self._format_communications(session.communications)
 
         return []
\ No newline at end of file
@@ -0,0 +1,60 @@
+"""
+Domain Match - hostname-based source classification
+Lets agents test a source URL against a domain list without scanning the whole URL
+"""
+
+import functools
+from urllib.parse import urlparse
+
+
+@functools.lru_cache(maxsize=4096)
+def host_labels(url: str) -> tuple:
+    """Lowercased hostname labels of a URL; empty for URLs without a parseable host"""
+    try:
+        hostname = urlparse(url if "//" in url else f"//{url}").hostname
+    except ValueError:
+        return ()
+    return tuple(label for label in (hostname or "").split(".") if label)
+
+
+@functools.lru_cache(maxsize=4096)
+def host_label_keys(url: str) -> frozenset:
+    """
+    Every contiguous run of hostname labels in a URL, bare and dot-prefixed
+
+    "https://pubmed.ncbi.nlm.nih.gov/123" yields "pubmed", "nih.gov", ".gov", "ncbi.nlm.nih.gov", ...
+    so domain lists may hold brand labels ("pubmed"), registered domains ("who.int") or
+    suffixes (".edu") and a source matches when the intersection is non-empty.
+    """
+    labels = host_labels(url)
+
+    keys = set()
+    for start in range(len(labels)):
+        for end in range(start + 1, len(labels) + 1):
+            run = ".".join(labels[start:end])
+            keys.add(run)
+            if start:
+                keys.add("." + run)
+    return frozenset(keys)
+
+
+class DomainSet:
+    """
+    Domain list a source URL is tested against
+
+    Dotted entries (".edu", "who.int", "scholar.google") must equal a run of hostname labels.
+    Bare brand entries match any hostname label that starts with them, so "cochrane" covers
+    www.cochranelibrary.com and "science" covers sciencedirect.com, as substring matching did.
+    """
+
+    __slots__ = ("_label_runs", "_brand_prefixes")
+
+    def __init__(self, entries):
+        entries = frozenset(entries)
+        self._label_runs = frozenset(entry for entry in entries if "." in entry)
+        self._brand_prefixes = tuple(sorted(entry for entry in entries if "." not in entry))
+
+    def matches(self, url: str) -> bool:
+        if self._label_runs & host_label_keys(url):
+            return True
+        return any(label.startswith(self._brand_prefixes) for label in host_labels(url))
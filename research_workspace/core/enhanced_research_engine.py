@@ -5,15 +5,33 @@ Combines sophisticated planning, deep web extraction, cross-source analysis, and
 
 import os
 import sys
+import asyncio
+import atexit
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
 from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime
-import time
 import concurrent.futures
-from threading import Lock
+from threading import BoundedSemaphore, Lock
 import re
 from bs4 import BeautifulSoup
+try:
+    import lxml.html  # Optional: C parser, much faster page text extraction
+except ImportError:
+    lxml = None
+try:
+    import orjson  # Optional: much faster prompt serialization and response parsing
+except ImportError:
+    orjson = None
+try:
+    import brotli  # Optional: lets urllib3 decode Brotli-compressed pages
+except ImportError:
+    try:
+        import brotlicffi as brotli
+    except ImportError:
+        brotli = None
 import urllib.parse
 from collections import defaultdict
 import hashlib
@@ -22,6 +40,159 @@ import hashlib
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', 'shared'))
 from config import Config
 
+from .result_cache import ResultCache, normalize_query
+
+# Serper hits and extracted page text, shared by every scout so overlapping sub-questions
+# and repeat topics skip the API and the page download; failures are never cached
+SERPER_CACHE = ResultCache(max_entries=1024, ttl_seconds=24 * 3600)
+PAGE_CACHE = ResultCache(max_entries=2048, ttl_seconds=7 * 24 * 3600)
+# ETag / Last-Modified of each extracted page with its text, kept past PAGE_CACHE expiry so
+# a refetch can be a conditional GET that reuses the text on 304 Not Modified
+PAGE_VALIDATORS = ResultCache(max_entries=2048)
+
+_NON_CONTENT_TAGS = ('script', 'style', 'nav', 'header', 'footer', 'aside')
+
+# Substrings of a source URL that earn the institutional-source bonus in ranking and quality
+_TRUSTED_DOMAIN_MARKERS = ('edu', 'org', 'gov')
+
+# Pages are read up to _MAX_PAGE_BYTES and their text collected up to _MAX_PAGE_TEXT_CHARS;
+# only the first _PAGE_EXCERPT_CHARS are kept, so the rest of a long page is never downloaded
+_MAX_PAGE_BYTES = 256 * 1024
+# Responses declaring a larger body, a non-HTML type, or URLs naming a binary file are
+# left to the search snippet rather than downloaded
+_MAX_DECLARED_PAGE_BYTES = 2 * 1024 * 1024
+_HTML_CONTENT_TYPES = ('text/html', 'application/xhtml+xml')
+_BINARY_PATH_RE = re.compile(
+    r'\.(?:pdf|zip|gz|tar|rar|7z|exe|dmg|mp[34]|m4a|mov|avi|mkv|webm|jpe?g|png|gif|webp|svg|'
+    r'docx?|xlsx?|pptx?)$',
+    re.IGNORECASE
+)
+_MAX_PAGE_TEXT_CHARS = 2000
+_PAGE_EXCERPT_CHARS = 1200
+# Less text than this (e.g. the byte cap ran out inside <head> or inline scripts) counts as a
+# failed extraction, so the source keeps its snippet and the page is not cached
+_MIN_PAGE_TEXT_CHARS = 50
+
+# Patterns used on every page and every model response, compiled once
+_WHITESPACE_RE = re.compile(r'\s+')
+_JSON_ARRAY_RE = re.compile(r'\[.*?\]', re.DOTALL)
+_JSON_OBJECT_RE = re.compile(r'\{.*\}', re.DOTALL)
+_JSON_FENCE_OPEN_RE = re.compile(r'```json\s*')
+_FENCE_CLOSE_RE = re.compile(r'```\s*$')
+_CITATION_RE = re.compile(r'\[([^\]]+)\]\(([^)]+)\)')
+_SECTION_HEADER_RE = re.compile(r'^#+', re.MULTILINE)
+_HEADER_START_RE = re.compile(r'\n(#{1,6})')
+_HEADER_LINE_RE = re.compile(r'(#{1,6}.*?)\n([^\n#])')
+_LIST_ITEM_RE = re.compile(r'\n(\s*[-*+])')
+_EXTRA_NEWLINES_RE = re.compile(r'\n{3,}')
+_SENTENCE_SPLIT_RE = re.compile(r'(?<=[.!?])\s+')
+_THEME_WORD_RE = re.compile(r'[a-z]{5,}')
+
+# Frequent long words that never make a useful cross-question theme
+_THEME_STOP_WORDS = frozenset({
+    "about", "after", "among", "based", "because", "before", "being", "between", "could",
+    "different", "during", "other", "should", "their", "there", "these", "those", "through",
+    "various", "where", "which", "while", "within", "would"
+})
+
+# Page downloads from every scout share one pool, created on first use and shut down at exit
+_FETCH_POOL_WORKERS = min(32, (os.cpu_count() or 4) * 5)
+_fetch_pool = None
+_fetch_pool_lock = Lock()
+
+def _get_fetch_pool() -> concurrent.futures.ThreadPoolExecutor:
+    global _fetch_pool
+    with _fetch_pool_lock:
+        if _fetch_pool is None:
+            _fetch_pool = concurrent.futures.ThreadPoolExecutor(
+                max_workers=_FETCH_POOL_WORKERS, thread_name_prefix="scout-fetch"
+            )
+            atexit.register(_fetch_pool.shutdown, wait=False)
+        return _fetch_pool
+
+def _cache_key(text: str) -> str:
+    return hashlib.sha256(text.encode()).hexdigest()
+
+def _html_to_text(html: bytes, max_chars: int = _MAX_PAGE_TEXT_CHARS) -> str:
+    """
+    Visible page text without scripts, styles and page chrome, whitespace collapsed
+
+    Text nodes are collected only until max_chars is passed, so the result is the page
+    text's prefix (at least max_chars long when the page has that much).
+    """
+    if lxml is not None:
+        if not html.strip():
+            return ''
+        # libxml2 assumes Latin-1 without a <meta charset> while bs4 detects UTF-8, so pin
+        # the encoding whenever the bytes decode as UTF-8
+        try:
+            html.decode('utf-8')
+            parser = lxml.html.HTMLParser(encoding='utf-8')
+        except UnicodeDecodeError:
+            parser = None
+        tree = lxml.html.fromstring(html, parser=parser)
+        for element in list(tree.iter(*_NON_CONTENT_TAGS)):
+            element.drop_tree()  # Keeps the element's tail text, like decompose()
+        pieces = (text.strip() for text in tree.itertext())
+    else:
+        soup = BeautifulSoup(html, 'html.parser')
+        for element in soup(list(_NON_CONTENT_TAGS)):
+            element.decompose()
+        pieces = soup.stripped_strings  # The strings get_text(separator=' ', strip=True) joins
+
+    kept = []
+    total_chars = 0
+    for piece in pieces:
+        if not piece:
+            continue
+        piece = _WHITESPACE_RE.sub(' ', piece)
+        kept.append(piece)
+        total_chars += len(piece) + 1
+        if total_chars > max_chars:
+            break
+
+    return ' '.join(kept)
+
+def _dumps_compact(data: Any) -> str:
+    """Compact JSON for prompts; the model does not need indentation, so more data fits the slice"""
+    if orjson is not None:
+        try:
+            return orjson.dumps(data).decode()
+        except TypeError:  # Non-str keys or values orjson cannot encode
+            pass
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':'))
+
+def _loads(text: str) -> Any:
+    """Parse model JSON output, falling back to the more lenient stdlib parser"""
+    if orjson is not None:
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(text)
+
+def _check_html_response(response):
+    """Raise for responses that are not HTML or declare an oversized body, before reading them"""
+    content_type = response.headers.get('Content-Type', '')
+    if content_type and not content_type.lower().startswith(_HTML_CONTENT_TYPES):
+        raise ValueError(f"Skipped non-HTML content: {content_type}")
+
+    content_length = response.headers.get('Content-Length', '')
+    if content_length.isdigit() and int(content_length) > _MAX_DECLARED_PAGE_BYTES:
+        raise ValueError(f"Skipped oversized page: {content_length} bytes")
+
+def _read_capped(response, max_bytes: int = _MAX_PAGE_BYTES) -> bytes:
+    """Body of a streamed response, abandoning the download after max_bytes"""
+    chunks = []
+    received = 0
+    for chunk in response.iter_content(chunk_size=8192):
+        chunks.append(chunk)
+        received += len(chunk)
+        if received >= max_bytes:
+            break
+    return b''.join(chunks)[:max_bytes]
+
+
 class QueryPlanner:
     """Advanced query decomposition using Galileo planner techniques"""
 
@@ -86,9 +257,9 @@ class QueryPlanner:
                 response_text = response.text
 
             # Extract JSON from response
-            json_match = re.search(r'\[.*?\]', response_text, re.DOTALL)
+            json_match = _JSON_ARRAY_RE.search(response_text)
             if json_match:
-                sub_questions = json.loads(json_match.group(0))
+                sub_questions = _loads(json_match.group(0))
                 return sub_questions[:num_questions]
 
             # Fallback parsing
@@ -131,70 +302,111 @@ class WebScout:
         self.min_sources_per_query = 5
         self.target_sources_per_query = 3  # Reduced for speed
         self.max_search_results = 12
-        self.rate_limit_lock = Lock()
+        self.max_concurrent_questions = 4
+
+        # Push-back: cap in-flight requests per host instead of sleeping between calls, so
+        # independent hosts proceed in parallel and only a busy host makes callers wait
+        self.max_requests_per_host = 4
+        self.serper_slots = BoundedSemaphore(self.max_requests_per_host)
+        self._host_slots = {}
+        self._host_slots_lock = Lock()
+
+        # One keep-alive pool for Serper and every scraped page, so repeat hosts skip the
+        # TCP/TLS handshake; transient connection failures are retried with a short backoff
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=20, pool_maxsize=50,
+                              max_retries=Retry(total=2, backoff_factor=0.3))
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
 
         self.scraping_headers = {
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
             'Accept-Language': 'en-US,en;q=0.5',
-            'Accept-Encoding': 'gzip, deflate',
+            'Accept-Encoding': 'gzip, deflate, br' if brotli is not None else 'gzip, deflate',
             'Connection': 'keep-alive'
         }
 
+    def close(self):
+        """Release pooled connections"""
+        self.session.close()
+
     def deep_search_all_questions(self, sub_questions: List[str]) -> Dict[str, List[Dict]]:
         """Deep search with content extraction for all sub-questions"""
 
         print(f"\n🔍 SCOUT: Starting deep web extraction for {len(sub_questions)} queries")
 
-        all_sources_data = {}
+        all_sources_data = asyncio.run(self._gather_question_sources(sub_questions))
+
+        total_sources = sum(len(sources) for sources in all_sources_data.values())
+        print(f"\n🔍 Deep extraction completed: {total_sources} sources with content extracted")
+
+        return all_sources_data
+
+    async def _gather_question_sources(self, sub_questions: List[str]) -> Dict[str, List[Dict]]:
+        """
+        Search every sub-question concurrently, then fetch each distinct URL exactly once
+
+        Phase 1 runs the Serper searches per question, phase 2 extracts the pooled results
+        in one batch (a URL shared by several questions is downloaded once and its content
+        copied into each question's result), and phase 3 tops up and ranks per question.
+        Blocking work runs in worker threads.
+        """
+
+        semaphore = asyncio.Semaphore(self.max_concurrent_questions)
+
+        async def run_per_question(step, question: str, *args) -> List[Dict]:
+            async with semaphore:
+                try:
+                    return await asyncio.to_thread(step, question, *args)
+                except Exception as e:
+                    print(f"   ❌ Extraction error: {e}")
+                    return []
 
         for i, question in enumerate(sub_questions, 1):
             print(f"\n📍 [{i}/{len(sub_questions)}] Extracting: {question[:60]}...")
 
-            try:
-                # Deep search with content extraction
-                question_sources = self._deep_search_with_extraction(question)
-
-                # Ensure minimum sources
-                if len(question_sources) < self.min_sources_per_query:
-                    additional_sources = self._search_deeper(question, len(question_sources))
-                    question_sources.extend(additional_sources)
+        # Phase 1: search results per question
+        question_results = await asyncio.gather(
+            *(run_per_question(self._search_candidates, question) for question in sub_questions)
+        )
 
-                # Rank by relevance and take top sources
-                ranked_sources = self._rank_by_relevance(question, question_sources)
-                final_sources = ranked_sources[:self.target_sources_per_query]
+        # Phase 2: one fetch per distinct URL across all questions, filled into every result
+        all_results = [result for results in question_results for result in results]
+        await asyncio.to_thread(self._extract_content_parallel, all_results)
 
-                all_sources_data[question] = final_sources
+        # Phase 3: top up thin questions and keep the most relevant sources
+        question_sources = await asyncio.gather(
+            *(run_per_question(self._finalize_sources, question, results)
+              for question, results in zip(sub_questions, question_results))
+        )
+        return dict(zip(sub_questions, question_sources))
 
-                print(f"   ✅ Extracted {len(final_sources)} high-quality sources")
+    def _finalize_sources(self, question: str, question_sources: List[Dict]) -> List[Dict]:
+        """Top-up and ranking for one sub-question's extracted sources"""
 
-                # Rate limiting
-                time.sleep(2)
+        # Ensure minimum sources
+        if len(question_sources) < self.min_sources_per_query:
+            additional_sources = self._search_deeper(question, len(question_sources))
+            question_sources.extend(additional_sources)
 
-            except Exception as e:
-                print(f"   ❌ Extraction error: {e}")
-                all_sources_data[question] = []
+        # Rank by relevance and take top sources
+        ranked_sources = self._rank_by_relevance(question, question_sources)
+        final_sources = ranked_sources[:self.target_sources_per_query]
 
-        total_sources = sum(len(sources) for sources in all_sources_data.values())
-        print(f"\n🔍 Deep extraction completed: {total_sources} sources with content extracted")
+        print(f"   ✅ Extracted {len(final_sources)} high-quality sources for: {question[:60]}")
 
-        return all_sources_data
+        return final_sources
 
-    def _deep_search_with_extraction(self, query: str) -> List[Dict]:
-        """Deep search with immediate content extraction"""
+    def _search_candidates(self, query: str) -> List[Dict]:
+        """Search results for one sub-question, deduplicated by URL"""
 
         # Multiple search strategies
         direct_results = self._serper_search(query)
         expanded_results = self._serper_search(f"{query} guide examples")
 
         # Combine and deduplicate
-        all_results = direct_results + expanded_results
-        unique_results = self._remove_duplicates(all_results)
-
-        # Extract content in parallel
-        results_with_content = self._extract_content_parallel(unique_results)
-
-        return results_with_content
+        return self._remove_duplicates(direct_results + expanded_results)
 
     def _serper_search(self, query: str) -> List[Dict]:
         """Search using Serper API"""
@@ -204,6 +416,11 @@ class WebScout:
             query = ' '.join(query.split()[:12])
         query = query.replace('"', '').replace('(', '').replace(')', '')
 
+        cache_key = _cache_key(normalize_query(query))
+        cached_results = SERPER_CACHE.get(cache_key)
+        if cached_results is not None:
+            return cached_results
+
         headers = {
             'X-API-KEY': self.serper_api_key,
             'Content-Type': 'application/json'
@@ -217,8 +434,8 @@ class WebScout:
         }
 
         try:
-            with self.rate_limit_lock:
-                response = requests.post(
+            with self.serper_slots:
+                response = self.session.post(
                     self.serper_url,
                     headers=headers,
                     data=json.dumps(payload),
@@ -240,6 +457,7 @@ class WebScout:
                     }
                     results.append(result)
 
+            SERPER_CACHE.put(cache_key, results)
             return results
 
         except Exception as e:
@@ -262,7 +480,6 @@ class WebScout:
                 break
             results = self._serper_search(term)
             deeper_results.extend(results[:3])
-            time.sleep(1)
 
         return deeper_results[:needed]
 
@@ -280,104 +497,153 @@ class WebScout:
 
         return unique_results
 
-    def _extract_content_parallel(self, results: List[Dict]) -> List[Dict]:
-        """Extract content from URLs in parallel"""
-
-        def extract_single_url(result):
-            try:
-                url = result.get('url', '')
-                if not url:
-                    return None
-
-                response = requests.get(url, headers=self.scraping_headers, timeout=10)
-                response.raise_for_status()
-
-                soup = BeautifulSoup(response.content, 'html.parser')
-
-                # Remove unwanted elements
-                for element in soup(['script', 'style', 'nav', 'header', 'footer', 'aside']):
-                    element.decompose()
-
-                content = soup.get_text(separator=' ', strip=True)
-                cleaned_content = re.sub(r'\s+', ' ', content).strip()
+    def _host_slot(self, url: str) -> BoundedSemaphore:
+        """Semaphore limiting concurrent fetches to the URL's host"""
+        host = urllib.parse.urlparse(url).netloc.lower()
+        with self._host_slots_lock:
+            slot = self._host_slots.get(host)
+            if slot is None:
+                slot = self._host_slots[host] = BoundedSemaphore(self.max_requests_per_host)
+            return slot
 
-                result.update({
-                    'extracted_content': cleaned_content[:1200],  # Limit content
-                    'content_length': len(cleaned_content),
-                    'extraction_success': True
-                })
-
-                return result
+    def _extract_content_parallel(self, results: List[Dict]) -> List[Dict]:
+        """Extract content from URLs in parallel, downloading each distinct URL once"""
+
+        def extract_single_url(url: str) -> Dict:
+            if _BINARY_PATH_RE.search(urllib.parse.urlparse(url).path):
+                raise ValueError("Skipped non-HTML URL")
+
+            cache_key = _cache_key(url)
+            cached_page = PAGE_CACHE.get(cache_key)
+            if cached_page is not None:
+                return cached_page
+
+            headers = self.scraping_headers
+            validators = PAGE_VALIDATORS.get(cache_key)
+            if validators is not None:
+                headers = dict(headers)
+                if validators['etag']:
+                    headers['If-None-Match'] = validators['etag']
+                if validators['last_modified']:
+                    headers['If-Modified-Since'] = validators['last_modified']
+
+            with self._host_slot(url):
+                with self.session.get(url, headers=headers, timeout=10, stream=True) as response:
+                    response.raise_for_status()
+                    not_modified = validators is not None and response.status_code == 304
+                    if not not_modified:
+                        _check_html_response(response)
+                        html = _read_capped(response)
+                        etag = response.headers.get('ETag')
+                        last_modified = response.headers.get('Last-Modified')
+
+            if not_modified:
+                page = validators['page']
+                PAGE_CACHE.put(cache_key, page)
+                return page
+
+            cleaned_content = _html_to_text(html)
+            if len(cleaned_content) < _MIN_PAGE_TEXT_CHARS:
+                raise ValueError(f"Too little page text extracted ({len(cleaned_content)} chars)")
+
+            excerpt = cleaned_content[:_PAGE_EXCERPT_CHARS]  # Limit content
+            page = {
+                'extracted_content': excerpt,
+                'content_length': len(cleaned_content),  # Capped near _MAX_PAGE_TEXT_CHARS
+                'extraction_success': True,
+                # Tokenized once per page for ranking; dropped once the source is scored
+                '_content_tokens': frozenset(word for word in excerpt.lower().split() if len(word) > 2)
+            }
+            PAGE_CACHE.put(cache_key, page)
+            if etag or last_modified:
+                PAGE_VALIDATORS.put(cache_key, {'etag': etag, 'last_modified': last_modified, 'page': page})
+            return page
 
-            except Exception as e:
-                result.update({
-                    'extracted_content': result.get('snippet', ''),
-                    'content_length': len(result.get('snippet', '')),
-                    'extraction_success': False,
-                    'extraction_error': str(e)
-                })
-                return result
+        # Results sharing a URL (case-insensitively) are filled from a single download
+        results_by_url = {}
+        for result in results:
+            url = result.get('url', '')
+            if url:
+                results_by_url.setdefault(url.lower(), []).append(result)
 
         results_with_content = []
 
-        with concurrent.futures.ThreadPoolExecutor(max_workers=5) as executor:
-            future_to_result = {
-                executor.submit(extract_single_url, result): result
-                for result in results
-            }
+        executor = _get_fetch_pool()
+        future_to_url = {
+            executor.submit(extract_single_url, url_results[0]['url']): url_key
+            for url_key, url_results in results_by_url.items()
+        }
 
-            for future in concurrent.futures.as_completed(future_to_result):
-                try:
-                    result_with_content = future.result(timeout=15)
-                    if result_with_content:
-                        results_with_content.append(result_with_content)
-                except Exception as e:
-                    print(f"   Content extraction failed: {e}")
+        for future in concurrent.futures.as_completed(future_to_url):
+            url_results = results_by_url[future_to_url[future]]
+            try:
+                page = future.result(timeout=15)
+            except Exception as e:
+                page = None
+                error = str(e)
+
+            for result in url_results:
+                if page is not None:
+                    result.update(page)
+                else:
+                    result.update({
+                        'extracted_content': result.get('snippet', ''),
+                        'content_length': len(result.get('snippet', '')),
+                        'extraction_success': False,
+                        'extraction_error': error
+                    })
+            results_with_content.extend(url_results)
 
         return results_with_content
 
     def _rank_by_relevance(self, query: str, sources: List[Dict]) -> List[Dict]:
         """Rank sources by relevance using Galileo techniques"""
 
+        # Tokenize the query once for the whole batch
+        query_words = frozenset(word for word in query.lower().split() if len(word) > 2)
+
         for source in sources:
-            relevance = self._calculate_relevance_score(query, source)
+            relevance = self._calculate_relevance_score(query_words, source)
             source['relevance_score'] = relevance
+            source.pop('_content_tokens', None)
 
         return sorted(sources, key=lambda x: x['relevance_score'], reverse=True)
 
-    def _calculate_relevance_score(self, query: str, source: Dict) -> float:
-        """Calculate relevance score using multiple factors"""
-
-        title = source.get('title', '').lower()
-        snippet = source.get('snippet', '').lower()
-        content = source.get('extracted_content', '').lower()
-        url = source.get('url', '').lower()
+    def _calculate_relevance_score(self, query_words: frozenset, source: Dict) -> float:
+        """
+        Calculate relevance score using multiple factors
 
-        query_words = set(word.strip() for word in query.lower().split() if len(word.strip()) > 2)
+        Each field scores the share of distinct query words it contains. Query words are
+        all longer than two characters, so intersecting with the raw field tokens gives the
+        same overlap without building a filtered set per field.
+        """
 
-        if not query_words:
+        word_count = len(query_words)
+        if not word_count:
             return 0.0
 
+        url = source.get('url', '').lower()
+
         # Title relevance (30%)
-        title_words = set(word.strip() for word in title.split() if len(word.strip()) > 2)
-        title_overlap = len(query_words.intersection(title_words))
-        title_score = (title_overlap / len(query_words)) * 0.30
+        title_overlap = len(query_words.intersection(source.get('title', '').lower().split()))
+        title_score = (title_overlap / word_count) * 0.30
 
         # Content relevance (40%)
-        content_words = set(word.strip() for word in content.split() if len(word.strip()) > 2)
+        content_words = source.get('_content_tokens')
+        if content_words is None:  # Snippet fallbacks and top-up results are not pre-tokenized
+            content_words = source.get('extracted_content', '').lower().split()
         content_overlap = len(query_words.intersection(content_words))
-        content_score = (content_overlap / len(query_words)) * 0.40
+        content_score = (content_overlap / word_count) * 0.40
 
         # Snippet relevance (20%)
-        snippet_words = set(word.strip() for word in snippet.split() if len(word.strip()) > 2)
-        snippet_overlap = len(query_words.intersection(snippet_words))
-        snippet_score = (snippet_overlap / len(query_words)) * 0.20
+        snippet_overlap = len(query_words.intersection(source.get('snippet', '').lower().split()))
+        snippet_score = (snippet_overlap / word_count) * 0.20
 
         # Quality indicators (10%)
         quality_score = 0.0
         if source.get('extraction_success', False):
             quality_score += 0.05
-        if any(domain in url for domain in ['edu', 'org', 'gov']):
+        if any(marker in url for marker in _TRUSTED_DOMAIN_MARKERS):
             quality_score += 0.05
 
         total_score = title_score + content_score + snippet_score + quality_score
@@ -397,6 +663,7 @@ class InformationAnalyst:
             import google.generativeai as genai
             genai.configure(api_key=Config.GEMINI_API_KEY)
             self.model = genai.GenerativeModel("gemini-2.5-flash")
+        self.max_concurrent_questions = 4
 
     def analyze_and_synthesize(self, sources_data: Dict[str, List[Dict]]) -> Dict:
         """Analyze and synthesize information across sources using Galileo techniques"""
@@ -416,24 +683,17 @@ class InformationAnalyst:
 
         total_sources = 0
 
+        question_analyses = asyncio.run(self._gather_question_analyses(sources_data))
+
         for sub_question, sources in sources_data.items():
             if not sources:
                 continue
 
-            print(f"\n📍 Analyzing: {sub_question[:60]}...")
+            synthesized_answer, quality_sources = question_analyses[sub_question]
 
-            try:
-                # Filter quality sources
-                quality_sources = self._assess_source_quality(sources)
-
-                # Extract information from each source
-                source_extractions = self._extract_information_from_sources(quality_sources, sub_question)
-
-                # Synthesize across sources
-                synthesized_answer = self._synthesize_information(source_extractions, sub_question)
-
-                # Store results
-                analysis_results['sub_question_answers'][sub_question] = synthesized_answer
+            # Store results
+            analysis_results['sub_question_answers'][sub_question] = synthesized_answer
+            if quality_sources is not None:
                 analysis_results['source_quality_analysis'][sub_question] = {
                     'total_sources': len(sources),
                     'quality_sources': len(quality_sources)
@@ -441,16 +701,6 @@ class InformationAnalyst:
 
                 total_sources += len(sources)
 
-                print(f"   ✅ Synthesized from {len(quality_sources)} quality sources")
-
-            except Exception as e:
-                print(f"   ❌ Analysis error: {e}")
-                analysis_results['sub_question_answers'][sub_question] = {
-                    'answer': f"Analysis failed: {str(e)}",
-                    'source_urls': [],
-                    'confidence_score': 0.0
-                }
-
         # Generate overall insights
         analysis_results['synthesized_insights'] = self._generate_overall_insights(
             analysis_results['sub_question_answers']
@@ -462,6 +712,51 @@ class InformationAnalyst:
 
         return analysis_results
 
+    async def _gather_question_analyses(self, sources_data: Dict[str, List[Dict]]) -> Dict[str, Tuple[Dict, Optional[List[Dict]]]]:
+        """
+        Analyze every sub-question concurrently; the blocking LLM calls run in worker threads
+
+        Returns each sub-question's synthesized answer with its quality sources, or with
+        None when the analysis failed. The semaphore keeps us within provider rate limits.
+        """
+
+        semaphore = asyncio.Semaphore(self.max_concurrent_questions)
+
+        async def analyze_question(sub_question: str, sources: List[Dict]):
+            async with semaphore:
+                print(f"\n📍 Analyzing: {sub_question[:60]}...")
+                try:
+                    return await asyncio.to_thread(self._analyze_question, sub_question, sources)
+                except Exception as e:
+                    print(f"   ❌ Analysis error: {e}")
+                    return {
+                        'answer': f"Analysis failed: {str(e)}",
+                        'source_urls': [],
+                        'confidence_score': 0.0
+                    }, None
+
+        questions = [(sub_question, sources) for sub_question, sources in sources_data.items() if sources]
+        analyses = await asyncio.gather(
+            *(analyze_question(sub_question, sources) for sub_question, sources in questions)
+        )
+        return {sub_question: analysis for (sub_question, _), analysis in zip(questions, analyses)}
+
+    def _analyze_question(self, sub_question: str, sources: List[Dict]) -> Tuple[Dict, List[Dict]]:
+        """Quality filter, extraction and synthesis for one sub-question"""
+
+        # Filter quality sources
+        quality_sources = self._assess_source_quality(sources)
+
+        # Extract information from each source
+        source_extractions = self._extract_information_from_sources(quality_sources, sub_question)
+
+        # Synthesize across sources
+        synthesized_answer = self._synthesize_information(source_extractions, sub_question)
+
+        print(f"   ✅ Synthesized from {len(quality_sources)} quality sources for: {sub_question[:60]}")
+
+        return synthesized_answer, quality_sources
+
     def _assess_source_quality(self, sources: List[Dict]) -> List[Dict]:
         """Assess source quality using multiple indicators"""
 
@@ -488,7 +783,7 @@ class InformationAnalyst:
                 quality_score += 0.2
 
             url = source.get('url', '').lower()
-            if any(domain in url for domain in ['edu', 'org', 'gov']):
+            if any(marker in url for marker in _TRUSTED_DOMAIN_MARKERS):
                 quality_score += 0.1
 
             source['quality_score'] = quality_score
@@ -504,50 +799,53 @@ class InformationAnalyst:
     def _extract_information_from_sources(self, sources: List[Dict], sub_question: str) -> List[Dict]:
         """Extract key information from each source"""
 
-        extractions = []
-
-        for source in sources:
-            try:
-                content = source.get('extracted_content', '')
-                if len(content) < 50:
-                    continue
-
-                extraction_result = self._ai_extract_information(content, sub_question, source)
+        sources = [source for source in sources if len(source.get('extracted_content', '')) >= 50]
+        if not sources:
+            return []
 
-                if extraction_result and extraction_result.get('key_information'):
-                    extractions.append(extraction_result)
+        try:
+            extraction_results = self._ai_extract_information_batch(sources, sub_question)
+        except Exception as e:
+            print(f"   ⚠️ Extraction failed for {len(sources)} sources: {e}")
+            return []
 
-            except Exception as e:
-                print(f"   ⚠️ Extraction failed for {source.get('url', 'unknown')}: {e}")
+        return [result for result in extraction_results if result.get('key_information')]
 
-        return extractions
+    def _ai_extract_information_batch(self, sources: List[Dict], sub_question: str) -> List[Dict]:
+        """Use AI to extract key information from all of a sub-question's sources in one call"""
 
-    def _ai_extract_information(self, content: str, sub_question: str, source: Dict) -> Dict:
-        """Use AI to extract key information from source content"""
+        source_blocks = "\n\n".join(
+            f"<<<SRC {index} url={source.get('url', 'unknown')}>>>\n{source.get('extracted_content', '')[:1500]}"
+            for index, source in enumerate(sources)
+        )
 
         extraction_prompt = f"""
-        Extract specific, factual information from this content to answer the sub-question.
+        Extract specific, factual information from each source below to answer the sub-question.
 
         SUB-QUESTION: "{sub_question}"
-        SOURCE: {source.get('url', 'unknown')}
 
-        CONTENT:
-        {content[:1500]}
+        SOURCES ({len(sources)}, each starting with a <<<SRC index url=...>>> marker):
+        {source_blocks}
 
-        Extract key facts that directly answer the sub-question. Return as JSON:
+        For every source, extract key facts that directly answer the sub-question. Return as JSON:
         {{
-            "key_information": [
+            "extractions": [
                 {{
-                    "fact": "specific factual statement",
-                    "relevance": "how this answers the question",
-                    "confidence": 0.9
+                    "src_index": 0,
+                    "key_information": [
+                        {{
+                            "fact": "specific factual statement",
+                            "relevance": "how this answers the question",
+                            "confidence": 0.9
+                        }}
+                    ],
+                    "main_points": ["key point 1", "key point 2"],
+                    "source_authority": {{
+                        "appears_reliable": true/false,
+                        "reasoning": "why reliable or not"
+                    }}
                 }}
-            ],
-            "main_points": ["key point 1", "key point 2"],
-            "source_authority": {{
-                "appears_reliable": true/false,
-                "reasoning": "why reliable or not"
-            }}
+            ]
         }}
 
         Only extract factual, specific information directly relevant to the sub-question.
@@ -558,7 +856,7 @@ class InformationAnalyst:
                 response = self.client.chat.completions.create(
                     model=Config.MODEL_NAME,
                     messages=[{"role": "user", "content": extraction_prompt}],
-                    max_tokens=1000,
+                    max_tokens=1000 * len(sources),
                     temperature=0.2
                 )
                 response_text = response.choices[0].message.content
@@ -568,7 +866,19 @@ class InformationAnalyst:
 
             # Clean and parse JSON
             cleaned_response = self._clean_json_response(response_text)
-            extraction_data = json.loads(cleaned_response)
+            batch_data = _loads(cleaned_response)
+
+        except Exception as e:
+            print(f"AI extraction error: {e}")
+            return []
+
+        # Fan the extractions back out to their sources
+        extractions = []
+        for extraction_data in batch_data.get('extractions', []):
+            src_index = extraction_data.pop('src_index', None)
+            if not isinstance(src_index, int) or not 0 <= src_index < len(sources):
+                continue
+            source = sources[src_index]
 
             # Add source metadata
             if 'key_information' in extraction_data:
@@ -582,12 +892,11 @@ class InformationAnalyst:
                 'quality_score': source.get('quality_score', 0),
                 'relevance_score': source.get('relevance_score', 0)
             }
+            extractions.append((src_index, extraction_data))
 
-            return extraction_data
-
-        except Exception as e:
-            print(f"AI extraction error: {e}")
-            return {}
+        # Keep the sources' quality order regardless of the order the model answered in
+        extractions.sort(key=lambda item: item[0])
+        return [extraction_data for _, extraction_data in extractions]
 
     def _synthesize_information(self, extractions: List[Dict], sub_question: str) -> Dict:
         """Synthesize information from multiple sources"""
@@ -615,7 +924,7 @@ class InformationAnalyst:
         QUESTION: "{sub_question}"
 
         EXTRACTED FACTS:
-        {json.dumps(all_facts, indent=2)[:2500]}
+        {_dumps_compact(all_facts)[:2500]}
 
         SOURCES: {len(all_sources)} analyzed
 
@@ -654,7 +963,7 @@ class InformationAnalyst:
                 response_text = response.text
 
             cleaned_response = self._clean_json_response(response_text)
-            synthesis_result = json.loads(cleaned_response)
+            synthesis_result = _loads(cleaned_response)
 
             source_urls = [s['url'] for s in all_sources if s.get('url')]
 
@@ -674,11 +983,14 @@ class InformationAnalyst:
     def _generate_overall_insights(self, sub_question_answers: Dict) -> Dict:
         """Generate overall insights connecting information across sub-questions"""
 
+        if not Config.AI_OVERALL_INSIGHTS:
+            return self._local_overall_insights(sub_question_answers)
+
         insights_prompt = f"""
         Generate overall insights by connecting information across all sub-questions.
 
         SUB-QUESTION ANSWERS:
-        {json.dumps({q: a.get('answer', '') for q, a in sub_question_answers.items()}, indent=2)[:2500]}
+        {_dumps_compact({q: a.get('answer', '') for q, a in sub_question_answers.items()})[:2500]}
 
         Identify:
         1. Common themes across sub-questions
@@ -709,13 +1021,70 @@ class InformationAnalyst:
                 response_text = response.text
 
             cleaned_response = self._clean_json_response(response_text)
-            return json.loads(cleaned_response)
+            return _loads(cleaned_response)
         except:
             return {
                 "key_insights": ["Analysis completed across multiple sources"],
                 "knowledge_synthesis": "Information synthesized from multiple sources"
             }
 
+    def _local_overall_insights(self, sub_question_answers: Dict) -> Dict:
+        """
+        Overall insights without an LLM round-trip
+
+        Themes are words that recur across two or more sub-question answers; key insights
+        are the answer sentences that mention the most of those shared themes.
+        """
+
+        answers = {
+            question: answer_data.get('answer', '')
+            for question, answer_data in sub_question_answers.items()
+            if answer_data.get('answer') and answer_data.get('confidence_score', 0) > 0
+        }
+        if not answers:
+            return {
+                "key_insights": ["Analysis completed across multiple sources"],
+                "knowledge_synthesis": "Information synthesized from multiple sources"
+            }
+
+        answer_terms = {
+            question: {word for word in _THEME_WORD_RE.findall(answer.lower()) if word not in _THEME_STOP_WORDS}
+            for question, answer in answers.items()
+        }
+        questions_by_term = defaultdict(list)
+        for question, terms in answer_terms.items():
+            for term in terms:
+                questions_by_term[term].append(question)
+
+        shared_terms = sorted(
+            (term for term, questions in questions_by_term.items() if len(questions) > 1),
+            key=lambda term: (-len(questions_by_term[term]), term)
+        )
+        thematic_connections = {term: questions_by_term[term] for term in shared_terms[:5]}
+
+        # Rank sentences by how many shared themes they touch; earlier sentences win ties
+        shared = frozenset(shared_terms)
+        scored_sentences = []
+        for answer in answers.values():
+            for sentence in _SENTENCE_SPLIT_RE.split(answer.strip()):
+                sentence_terms = shared.intersection(_THEME_WORD_RE.findall(sentence.lower()))
+                if sentence_terms:
+                    scored_sentences.append((-len(sentence_terms), len(scored_sentences), sentence))
+        key_insights = [sentence for _, _, sentence in sorted(scored_sentences)[:3]]
+        if not key_insights:
+            key_insights = [_SENTENCE_SPLIT_RE.split(answer.strip())[0] for answer in answers.values()][:3]
+
+        if thematic_connections:
+            knowledge_synthesis = f"Themes shared across sub-questions: {', '.join(thematic_connections)}."
+        else:
+            knowledge_synthesis = "Sub-questions cover largely separate aspects of the topic."
+
+        return {
+            "key_insights": key_insights,
+            "thematic_connections": thematic_connections,
+            "knowledge_synthesis": knowledge_synthesis
+        }
+
     def _fallback_synthesis(self, all_facts: List[Dict], all_sources: List[Dict], sub_question: str) -> Dict:
         """Fallback synthesis when AI fails"""
 
@@ -745,10 +1114,10 @@ class InformationAnalyst:
     def _clean_json_response(self, response_text: str) -> str:
         """Clean JSON response"""
         try:
-            cleaned = re.sub(r'```json\s*', '', response_text)
-            cleaned = re.sub(r'```\s*$', '', cleaned)
+            cleaned = _JSON_FENCE_OPEN_RE.sub('', response_text)
+            cleaned = _FENCE_CLOSE_RE.sub('', cleaned)
 
-            json_match = re.search(r'\{.*\}', cleaned, re.DOTALL)
+            json_match = _JSON_OBJECT_RE.search(cleaned)
             if json_match:
                 return json_match.group(0)
 
@@ -867,13 +1236,13 @@ class ReportWriter:
         TOPIC: "{user_topic}"
 
         RESEARCH DATA:
-        {json.dumps({q: a.get('answer', '') for q, a in sub_question_answers.items()}, indent=2)[:3000]}
+        {_dumps_compact({q: a.get('answer', '') for q, a in sub_question_answers.items()})[:3000]}
 
         INSIGHTS:
-        {json.dumps(synthesized_insights, indent=2)[:1000]}
+        {_dumps_compact(synthesized_insights)[:1000]}
 
         CITATION MAP:
-        {json.dumps(source_citation_map, indent=2)[:1500]}
+        {_dumps_compact(source_citation_map)[:1500]}
 
         CRITICAL REQUIREMENTS:
         1. **MANDATORY INLINE CITATIONS**: Every factual statement MUST be followed by [Source Title](URL)
@@ -936,8 +1305,7 @@ class ReportWriter:
         """Validate citations and format report"""
 
         # Count citations
-        citation_pattern = r'\[([^\]]+)\]\(([^)]+)\)'
-        citations = re.findall(citation_pattern, markdown_report)
+        citations = _CITATION_RE.findall(markdown_report)
 
         print(f"🔍 Found {len(citations)} citations in report")
 
@@ -955,14 +1323,14 @@ class ReportWriter:
         formatted = report
 
         # Fix header spacing
-        formatted = re.sub(r'\n(#{1,6})', r'\n\n\1', formatted)
-        formatted = re.sub(r'(#{1,6}.*?)\n([^\n#])', r'\1\n\n\2', formatted)
+        formatted = _HEADER_START_RE.sub(r'\n\n\1', formatted)
+        formatted = _HEADER_LINE_RE.sub(r'\1\n\n\2', formatted)
 
         # Fix list spacing
-        formatted = re.sub(r'\n(\s*[-*+])', r'\n\n\1', formatted)
+        formatted = _LIST_ITEM_RE.sub(r'\n\n\1', formatted)
 
         # Clean multiple newlines
-        formatted = re.sub(r'\n{3,}', '\n\n', formatted)
+        formatted = _EXTRA_NEWLINES_RE.sub('\n\n', formatted)
 
         return formatted.strip()
 
@@ -982,8 +1350,8 @@ Format: Evidence-Backed Research Report
         """Generate comprehensive report metadata"""
 
         word_count = len(report.split())
-        citation_count = len(re.findall(r'\[([^\]]+)\]\(([^)]+)\)', report))
-        section_count = len(re.findall(r'^#+', report, re.MULTILINE))
+        citation_count = len(_CITATION_RE.findall(report))
+        section_count = len(_SECTION_HEADER_RE.findall(report))
 
         total_sources = analysis_results.get('metadata', {}).get('total_sources_analyzed', 0)
 
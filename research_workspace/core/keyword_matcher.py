@@ -0,0 +1,55 @@
+"""
+Keyword Matcher - single-pass multi-term substring scanning
+Finds every vocabulary term contained in a text with one compiled regex pass
+"""
+
+import re
+import sys
+from collections import Counter
+from typing import Dict, Iterable, Iterator, Set
+
+
+class KeywordMatcher:
+    """
+    Matches a fixed vocabulary against text in one pass, like an Aho-Corasick automaton
+
+    Semantics equal `term in text` for every term: each start position is probed with a
+    longest-first lookahead alternation, and every shorter term that is a prefix of the
+    match is credited too, so overlapping and nested terms are never missed.
+    """
+
+    def __init__(self, terms: Iterable[str]):
+        # Interned, so the result keys are the callers' module-level term objects and their
+        # `term in found` / `counts[term]` lookups hit the identity fast path
+        vocabulary = sorted(set(map(sys.intern, terms)) - {""}, key=len, reverse=True)
+
+        # Every term found at a position is a prefix of the longest term found there
+        self._prefixes: Dict[str, tuple] = {
+            term: tuple(other for other in vocabulary if term.startswith(other))
+            for term in vocabulary
+        }
+
+        if vocabulary:
+            self._pattern = re.compile("(?=(" + "|".join(map(re.escape, vocabulary)) + "))")
+        else:
+            self._pattern = None
+
+    def iter_matches(self, text: str) -> Iterator[str]:
+        """Yield one term per occurrence (per start position) in the text"""
+        if self._pattern is None:
+            return
+
+        for match in self._pattern.finditer(text):
+            yield from self._prefixes[match.group(1)]
+
+    def contains_any(self, text: str) -> bool:
+        """Whether any vocabulary term occurs in the text (stops at the first hit)"""
+        return self._pattern is not None and self._pattern.search(text) is not None
+
+    def found(self, text: str) -> Set[str]:
+        """Terms that occur anywhere in the text"""
+        return set(self.iter_matches(text))
+
+    def counts(self, text: str) -> Counter:
+        """Occurrence count per term (matches str.count for terms that cannot overlap themselves)"""
+        return Counter(self.iter_matches(text))
@@ -6,15 +6,20 @@ This engine performs actual web searches and AI analysis
 import os
 import sys
 import requests
+from requests.adapters import HTTPAdapter
 import json
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Callable
 from datetime import datetime
 import time
+import threading
 
 # Add paths for configuration
 sys.path.append(os.path.join(os.path.dirname(__file__), '../../shared'))
 from config import Config
 
+# After a Gemini failure, callers that can fall back skip the AI for this long
+AI_RETRY_SECONDS = 60
+
 class RealResearchEngine:
     """
     Core research engine that performs real web searches and AI analysis
@@ -25,6 +30,17 @@ class RealResearchEngine:
         self.serper_api_key = Config.SERPER_API_KEY
         self.use_openai = Config.USE_OPENAI
 
+        # Keep-alive connection pool shared by every search call, so repeated Serper
+        # requests from concurrent agents reuse TLS connections instead of reconnecting
+        self.http = requests.Session()
+        self.http.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=16))
+
+        # AI clients are built on first use and then reused for every analysis
+        self._openai_client = None
+        self._gemini_model = None
+        self._ai_client_lock = threading.Lock()
+        self._ai_unavailable_until = 0.0
+
         if self.use_openai:
             self.openai_api_key = Config.OPENAI_API_KEY
             if not self.serper_api_key or not self.openai_api_key:
@@ -66,7 +82,7 @@ class RealResearchEngine:
 
         try:
             print(f"🔍 Searching web for: {query}")
-            response = requests.post(url, headers=headers, data=payload, timeout=30)
+            response = self.http.post(url, headers=headers, data=payload, timeout=30)
             response.raise_for_status()
 
             search_data = response.json()
@@ -117,6 +133,34 @@ class RealResearchEngine:
                 "news_results": []
             }
 
+    def is_ai_available(self) -> bool:
+        """Cheap health flag: False for AI_RETRY_SECONDS after a Gemini analysis failed"""
+        return time.monotonic() >= self._ai_unavailable_until
+
+    def _mark_ai_unavailable(self):
+        self._ai_unavailable_until = time.monotonic() + AI_RETRY_SECONDS
+
+    def _get_openai_client(self):
+        """OpenAI client, created once per engine so its connection pool is reused"""
+        if self._openai_client is None:
+            with self._ai_client_lock:
+                if self._openai_client is None:
+                    from openai import OpenAI
+                    self._openai_client = OpenAI(api_key=self.openai_api_key)
+        return self._openai_client
+
+    def _get_gemini_model(self):
+        """Configured Gemini model, created once per engine"""
+        if self._gemini_model is None:
+            with self._ai_client_lock:
+                if self._gemini_model is None:
+                    import google.generativeai as genai
+                    genai.configure(api_key=self.gemini_api_key)
+
+                    # Use Gemini 2.5 Flash for fast analysis
+                    self._gemini_model = genai.GenerativeModel('gemini-2.0-flash-exp')
+        return self._gemini_model
+
     def analyze_with_ai(self, content: str, analysis_type: str = "general") -> Dict[str, Any]:
         """
         Analyze content using configured AI API (OpenAI or Gemini)
@@ -147,8 +191,7 @@ class RealResearchEngine:
         """
 
         try:
-            from openai import OpenAI
-            client = OpenAI(api_key=self.openai_api_key)
+            client = self._get_openai_client()
 
         except ImportError:
             print("❌ OpenAI library not installed")
@@ -260,13 +303,15 @@ class RealResearchEngine:
             print(f"❌ OpenAI analysis error: {str(e)}")
             return {"error": str(e), "analysis": "Analysis failed due to API error"}
 
-    def analyze_with_gemini(self, content: str, analysis_type: str = "general") -> Dict[str, Any]:
+    def analyze_with_gemini(self, content: str, analysis_type: str = "general",
+                            on_text: Optional[Callable[[str], None]] = None) -> Dict[str, Any]:
         """
         Analyze content using Google Gemini API
 
         Args:
             content: Content to analyze
             analysis_type: Type of analysis (general, medical, financial, technical, etc.)
+            on_text: Optional callback; when given the response is streamed and handed over in batches
 
         Returns:
             Dictionary containing AI analysis results
@@ -274,17 +319,15 @@ class RealResearchEngine:
 
         # Import Gemini here to avoid import errors if not installed
         try:
-            import google.generativeai as genai
-            genai.configure(api_key=self.gemini_api_key)
-
-            # Use Gemini 2.5 Flash for fast analysis
-            model = genai.GenerativeModel('gemini-2.0-flash-exp')
+            model = self._get_gemini_model()
 
         except ImportError:
             print("❌ Google GenerativeAI library not installed")
+            self._mark_ai_unavailable()
             return {"error": "Gemini library not available", "analysis": ""}
         except Exception as e:
             print(f"❌ Gemini configuration error: {str(e)}")
+            self._mark_ai_unavailable()
             return {"error": str(e), "analysis": ""}
 
         # Create detailed analysis prompts for comprehensive reports
@@ -416,8 +459,11 @@ class RealResearchEngine:
 
             def generate_with_timeout():
                 try:
-                    response = model.generate_content(prompt, generation_config=generation_config)
-                    result_container['response'] = response
+                    if on_text is not None:
+                        result_container['text'] = self._stream_generation(model, prompt, generation_config, on_text)
+                    else:
+                        response = model.generate_content(prompt, generation_config=generation_config)
+                        result_container['response'] = response
                 except Exception as e:
                     error_container['error'] = e
 
@@ -431,6 +477,7 @@ class RealResearchEngine:
 
             if thread.is_alive():
                 print("⏰ Gemini analysis timed out, generating fallback response")
+                self._mark_ai_unavailable()
                 return {
                     "analysis_type": analysis_type,
                     "error": "Analysis timed out",
@@ -444,13 +491,15 @@ class RealResearchEngine:
             if 'error' in error_container:
                 raise error_container['error']
 
-            if 'response' not in result_container:
-                raise Exception("No response received")
-
-            response = result_container['response']
+            if 'text' in result_container:
+                analysis_text = result_container['text']
+            elif 'response' in result_container:
+                response = result_container['response']
 
-            # Extract the analysis text
-            analysis_text = response.text if hasattr(response, 'text') else str(response)
+                # Extract the analysis text
+                analysis_text = response.text if hasattr(response, 'text') else str(response)
+            else:
+                raise Exception("No response received")
 
             # Parse the structured response
             analysis_result = {
@@ -464,10 +513,12 @@ class RealResearchEngine:
             }
 
             print(f"✅ Gemini analysis completed ({len(analysis_text)} characters)")
+            self._ai_unavailable_until = 0.0
             return analysis_result
 
         except Exception as e:
             print(f"❌ Gemini analysis error: {str(e)}")
+            self._mark_ai_unavailable()
             return {
                 "analysis_type": analysis_type,
                 "error": str(e),
@@ -478,6 +529,30 @@ class RealResearchEngine:
                 "summary": f"Analysis failed: {str(e)}"
             }
 
+    def _stream_generation(self, model, prompt: str, generation_config: Dict[str, Any],
+                           on_text: Callable[[str], None], batch_size: int = 5, max_wait: float = 0.1) -> str:
+        """Stream a Gemini response, flushing text to on_text every batch_size chunks or max_wait seconds"""
+        parts = []
+        pending = []
+        last_flush = time.monotonic()
+
+        for chunk in model.generate_content(prompt, generation_config=generation_config, stream=True):
+            pending.append(chunk.text)
+
+            if len(pending) >= batch_size or time.monotonic() - last_flush >= max_wait:
+                batch = "".join(pending)
+                parts.append(batch)
+                on_text(batch)
+                pending = []
+                last_flush = time.monotonic()
+
+        if pending:
+            batch = "".join(pending)
+            parts.append(batch)
+            on_text(batch)
+
+        return "".join(parts)
+
     def deep_web_research(self, query: str) -> Dict[str, Any]:
         """Perform DEEP web research with 50-100+ sources for extraordinary reports"""
 
@@ -603,7 +678,7 @@ class RealResearchEngine:
             "hl": "en"
         })
 
-        response = requests.post(url, headers=headers, data=payload, timeout=15)
+        response = self.http.post(url, headers=headers, data=payload, timeout=15)
         if response.status_code == 200:
             return response.json()
         else:
@@ -624,7 +699,7 @@ class RealResearchEngine:
                 'Content-Type': 'application/json'
             }
 
-            news_response = requests.post(news_url, headers=headers, data=news_payload, timeout=15)
+            news_response = self.http.post(news_url, headers=headers, data=news_payload, timeout=15)
             if news_response.status_code == 200:
                 news_data = news_response.json()
                 return news_data.get("news", [])
@@ -889,4 +964,17 @@ class RealResearchEngine:
         if paragraphs:
             return paragraphs[0].strip()
 
-        return "Summary not available"
\ No newline at end of file
+        return "Summary not available"
+
+
+_default_engine: Optional[RealResearchEngine] = None
+_default_engine_lock = threading.Lock()
+
+def get_default_engine() -> RealResearchEngine:
+    """Process-wide engine shared by all agents, created on first use"""
+    global _default_engine
+    if _default_engine is None:
+        with _default_engine_lock:
+            if _default_engine is None:
+                _default_engine = RealResearchEngine()
+    return _default_engine
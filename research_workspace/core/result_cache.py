@@ -0,0 +1,80 @@
+"""
+Result Cache - bounded, thread-safe memoization for expensive research calls
+LRU eviction with an optional time-to-live; values are deep-copied in and out
+"""
+
+import copy
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional
+
+
+def normalize_query(query: str) -> str:
+    """Case- and whitespace-insensitive cache key for a research query"""
+    return " ".join(query.lower().split())
+
+
+class ResultCache:
+    """
+    LRU cache for research results
+
+    Callers post-process and mutate the dicts they get back, so values are deep-copied on
+    the way in and out to keep cached entries pristine. Results flagged `"success": False`
+    are never stored, so a transient failure is retried on the next call.
+
+    Args:
+        max_entries: Entries kept before the least recently used one is evicted
+        ttl_seconds: Optional lifetime of an entry; None keeps entries until evicted
+    """
+
+    def __init__(self, max_entries: int = 128, ttl_seconds: Optional[float] = None):
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._max_entries = max_entries
+        self._ttl_seconds = ttl_seconds
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Cached value for the key, or None when missing or expired"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            stored_at, value = entry
+            if self._ttl_seconds is not None and time.monotonic() - stored_at > self._ttl_seconds:
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+
+        return copy.deepcopy(value)
+
+    def put(self, key: Hashable, value: Any):
+        """Store a value unless it is a failed result"""
+        if isinstance(value, dict) and value.get("success") is False:
+            return
+
+        value = copy.deepcopy(value)
+        with self._lock:
+            self._entries[key] = (time.monotonic(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """Return the cached value, or compute, store and return it"""
+        cached = self.get(key)
+        if cached is not None:
+            return cached
+
+        value = compute()
+        self.put(key, value)
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
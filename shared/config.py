@@ -21,6 +21,7 @@ class Config:
     # Agent Settings - Reduced for faster processing
     MAX_SUB_QUESTIONS = 3
     MIN_SUB_QUESTIONS = 2
+    AI_OVERALL_INSIGHTS = False  # True asks the LLM for cross-question insights (one more, slower call)
 
     @classmethod
     def validate(cls):
@@ -0,0 +1,44 @@
+"""Multi-page PDF export builds"""
+
+import re
+from datetime import datetime
+
+import pytest
+
+pytest.importorskip("streamlit")
+pytest.importorskip("reportlab")
+
+import enhanced_display_functions as edf
+
+
+def _long_report(lines: int = 400) -> str:
+    parts = []
+    for i in range(lines):
+        if i % 10 == 0:
+            parts.append(f"## Section {i}")
+        elif i % 3 == 0:
+            parts.append("- list item " + "word " * (i % 40 + 1))
+        else:
+            parts.append(f"Paragraph {i} " + "word " * (i % 120 + 1))
+    return "\n".join(parts)
+
+
+def _bibliography(count: int = 200, domains: int = 97) -> tuple:
+    # Many small per-domain groups, so domain gaps land at several page bottoms
+    return tuple(
+        (f"https://site{i % domains}.example.com/page{i}", {'title': f"Source {i}"})
+        for i in range(count)
+    )
+
+
+@pytest.mark.parametrize("markdown_report, source_items", [
+    (_long_report(), ()),
+    ("", _bibliography()),
+    (_long_report(), _bibliography()),
+], ids=["report", "bibliography", "report-and-bibliography"])
+def test_build_pdf_spans_many_pages(markdown_report, source_items):
+    pdf = edf._build_pdf(
+        "multi-page query", markdown_report, (('word_count', 1000),), source_items, datetime(2026, 1, 1)
+    )
+    assert pdf.startswith(b"%PDF")
+    assert len(re.findall(rb"/Type /Page[^s]", pdf)) > 3